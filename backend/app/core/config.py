@@ -27,6 +27,12 @@ class Settings(BaseSettings):
     # Supabase
     supabase_url: str = Field(..., env="SUPABASE_URL")
     supabase_key: str = Field(..., env="SUPABASE_KEY")
+    # Direct Postgres DSN; when set (and asyncpg is installed) the Pipecat
+    # DB connector bypasses PostgREST and talks to Postgres over a pool
+    supabase_db_url: Optional[str] = Field(None, env="SUPABASE_DB_URL")
+    # Ceiling on concurrent database requests from the Pipecat connector;
+    # keeps burst load below what the Supabase pooler tolerates
+    db_concurrency_limit: int = Field(20, env="DB_CONCURRENCY_LIMIT")
     
     # Retell AI
     retell_api_key: str = Field(..., env="RETELL_API_KEY")
@@ -56,6 +56,21 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Shutting down application")
 
+    # Cancel any still-running pipelines in one batch, finish in-flight
+    # completions and buffered writes, then release pooled HTTP and DB
+    # connections
+    from app.services.pipecat.transport.webrtc.daily_room_service import get_daily_room_service
+    from app.services.pipecat.db.supabase_connector import get_db_connector
+    from app.services.pipecat.call.call_completion_service import get_call_completion_service
+    from app.services.pipecat.session.session_manager import get_session_manager
+    from app.services.pipecat.pipeline.pipeline_utils import PipecatSessionUtils
+    await PipecatSessionUtils.cancel_pipelines(
+        list(get_session_manager().active_sessions.values())
+    )
+    await get_call_completion_service().drain()
+    await get_daily_room_service().close()
+    await get_db_connector().close()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -153,6 +153,9 @@ class CallResultsBase(BaseModel):
     raw_extraction: Optional[Dict[str, Any]] = None
     confidence_score: Optional[float] = None
 
+    # Cost breakdown (stored in its own column)
+    cost_breakdown: Optional[Dict[str, Any]] = None
+
 
 class CallResultsCreate(CallResultsBase):
     """Schema for creating call results."""
@@ -5,16 +5,18 @@ Defines data models for cost calculations and breakdowns
 for voice call services (STT, TTS, LLM, Transport).
 """
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ServiceCost(BaseModel):
     """
     Cost breakdown for a single service.
-    
+
     Represents the cost calculation for one service component
     (e.g., STT, TTS, LLM, or Transport) with unit pricing details.
     """
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     service_name: str = Field(..., description="Name of the service (e.g., 'Deepgram', 'Cartesia')")
     model: Optional[str] = Field(None, description="Specific model used (e.g., 'nova-2', 'gpt-4o')")
     units: float = Field(..., description="Number of units consumed (minutes, characters, tokens, etc.)")
@@ -30,6 +32,8 @@ class CostBreakdown(BaseModel):
     Aggregates costs from all service components with individual
     breakdowns and total cost calculation.
     """
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     stt_cost: Optional[ServiceCost] = Field(None, description="Speech-to-Text service cost")
     tts_cost: Optional[ServiceCost] = Field(None, description="Text-to-Speech service cost")
     llm_cost: Optional[ServiceCost] = Field(None, description="LLM service cost")
@@ -1,9 +1,10 @@
 """
 Call Service - Manages call operations and records.
 """
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
 from app.db.database import get_supabase_client, Tables
@@ -13,15 +14,31 @@ from app.schemas.call import (
     CallResponse,
     CallListResponse,
     CallStatus,
+    CallOutcome,
     CallResultsCreate,
     CallResultsResponse,
+    DriverStatus,
+    EmergencyType,
 )
 from app.services.retell_service import get_retell_service
 from app.services.agent_service import get_agent_service
 from app.services.pipecat.transcript.transcript_processor import get_transcript_processor
+from app.services.pipecat.db.models import CallContext
 
 logger = logging.getLogger(__name__)
 
+# Precomputed value -> enum member lookups; dict access is much cheaper than
+# the Enum __call__ protocol on per-row mapping paths.
+_STATUS_LOOKUP = {s.value: s for s in CallStatus}
+_OUTCOME_LOOKUP = {o.value: o for o in CallOutcome}
+_DRIVER_STATUS_LOOKUP = {d.value: d for d in DriverStatus}
+_EMERGENCY_TYPE_LOOKUP = {e.value: e for e in EmergencyType}
+
+
+def _parse_db_datetime(value: str) -> datetime:
+    """Parse an ISO timestamp from the database, tolerating Z-suffix strings."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class CallService:
     """Service for managing voice calls."""
@@ -29,9 +46,17 @@ class CallService:
     def __init__(self):
         """Initialize call service."""
         self.db = get_supabase_client()
+        # Cached table handles - avoids constructing a new request builder per query.
+        # Builders are stateless between calls; each query chains off the cached base.
+        self._t_calls = self.db.table(Tables.CALLS)
+        self._t_results = self.db.table(Tables.CALL_RESULTS)
         self.retell = get_retell_service()
         self.agent_service = get_agent_service()
         self.transcript_processor = get_transcript_processor()
+        # Strong references to fire-and-forget completion tasks; the event
+        # loop only keeps weak ones, so an unreferenced task can be
+        # garbage-collected mid-flight
+        self._completion_tasks: set = set()
 
     async def trigger_call(self, request: CallTriggerRequest) -> CallResponse:
         """
@@ -54,7 +79,7 @@ class CallService:
 
             # Generate call ID
             call_id = str(uuid.uuid4())
-            now = datetime.utcnow().isoformat()
+            now = datetime.now(timezone.utc).isoformat()
 
             # Prepare dynamic variables for prompt injection
             dynamic_variables = {
@@ -101,7 +126,7 @@ class CallService:
                 "updated_at": now,
             }
 
-            result = self.db.table(Tables.CALLS).insert(db_record).execute()
+            result = self._t_calls.insert(db_record).execute()
 
             logger.info(f"Triggered web call: {call_id} -> Retell: {retell_call['call_id']}")
 
@@ -122,18 +147,21 @@ class CallService:
             Call response with results or None
         """
         try:
-            result = self.db.table(Tables.CALLS).select("*").eq("id", call_id).execute()
+            # Embedded resource select: PostgREST joins call_results
+            # server-side, so call + results cost one round trip
+            result = self._t_calls.select("*, call_results(*)").eq("id", call_id).execute()
 
             if not result.data:
                 return None
 
-            call_data = result.data[0]
-
-            # Get results if available
-            results = await self.get_call_results(call_id)
+            call_data = dict(result.data[0])
+            embedded = call_data.pop("call_results", None)
+            if isinstance(embedded, list):
+                embedded = embedded[0] if embedded else None
 
             response = self._map_to_response(call_data)
-            response.results = results
+            if embedded:
+                response.results = self._map_results_to_response(embedded)
 
             return response
 
@@ -152,7 +180,7 @@ class CallService:
             Call response or None
         """
         try:
-            result = self.db.table(Tables.CALLS).select("*").eq("retell_call_id", retell_call_id).execute()
+            result = self._t_calls.select("*").eq("retell_call_id", retell_call_id).execute()
 
             if not result.data:
                 return None
@@ -183,7 +211,7 @@ class CallService:
             List of calls with total count
         """
         try:
-            query = self.db.table(Tables.CALLS).select("*", count="exact")
+            query = self._t_calls.select("*", count="exact")
 
             if agent_id:
                 query = query.eq("agent_id", agent_id)
@@ -236,21 +264,17 @@ class CallService:
             Updated call response
         """
         try:
-            update_data = {
+            candidates = {
                 "status": status.value,
-                "updated_at": datetime.utcnow().isoformat(),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "transcript": transcript,
+                "recording_url": recording_url,
+                "duration_seconds": duration_seconds,
+                "ended_at": ended_at.isoformat() if ended_at else None,
             }
+            update_data = {k: v for k, v in candidates.items() if v is not None}
 
-            if transcript:
-                update_data["transcript"] = transcript
-            if recording_url:
-                update_data["recording_url"] = recording_url
-            if duration_seconds is not None:
-                update_data["duration_seconds"] = duration_seconds
-            if ended_at:
-                update_data["ended_at"] = ended_at.isoformat()
-
-            result = self.db.table(Tables.CALLS).update(update_data).eq("id", call_id).execute()
+            result = self._t_calls.update(update_data).eq("id", call_id).execute()
 
             if not result.data:
                 return None
@@ -295,16 +319,17 @@ class CallService:
                 transcript=transcript,
                 recording_url=recording_url,
                 duration_seconds=duration_seconds,
-                ended_at=datetime.utcnow()
+                ended_at=datetime.now(timezone.utc)
             )
 
-            # Build context for extraction
-            call_context = {
-                "driver_name": call.driver_name,
-                "load_number": call.load_number,
-                "origin": call.origin,
-                "destination": call.destination,
-            }
+            # Build context for extraction (fields come from an already
+            # validated CallResponse, so skip re-validation)
+            call_context = CallContext.model_construct(
+                driver_name=call.driver_name,
+                load_number=call.load_number,
+                origin=call.origin,
+                destination=call.destination,
+            )
 
             # Process transcript to extract structured data
             results = await self.transcript_processor.process_call_transcript(
@@ -335,11 +360,11 @@ class CallService:
             Saved results response
         """
         try:
-            result_id = str(uuid.uuid4())
-            now = datetime.utcnow().isoformat()
+            now = datetime.now(timezone.utc).isoformat()
 
+            # id is omitted so the column default applies on insert and the
+            # existing row keeps its id when a re-sync updates results
             db_record = {
-                "id": result_id,
                 "call_id": results.call_id,
                 "call_outcome": results.call_outcome.value,
                 "is_emergency": results.is_emergency,
@@ -357,10 +382,14 @@ class CallService:
                 "escalation_status": results.escalation_status,
                 "raw_extraction": results.raw_extraction,
                 "confidence_score": results.confidence_score,
+                "cost_breakdown": results.cost_breakdown,
                 "created_at": now,
             }
 
-            result = self.db.table(Tables.CALL_RESULTS).insert(db_record).execute()
+            # Upsert on call_id: results are unique per call
+            # (uq_call_results_call_id), and a re-synced webhook replaces
+            # the existing row instead of hitting a duplicate-key error
+            result = self._t_results.upsert(db_record, on_conflict="call_id").execute()
 
             return self._map_results_to_response(result.data[0])
 
@@ -379,7 +408,7 @@ class CallService:
             Call results or None
         """
         try:
-            result = self.db.table(Tables.CALL_RESULTS).select("*").eq("call_id", call_id).execute()
+            result = self._t_results.select("*").eq("call_id", call_id).execute()
 
             if not result.data:
                 return None
@@ -391,8 +420,13 @@ class CallService:
             raise
 
     def _map_to_response(self, row: dict) -> CallResponse:
-        """Map database row to call response."""
-        return CallResponse(
+        """Map database row to call response.
+
+        Uses model_construct to skip Pydantic validation - rows come straight
+        from our own schema, so per-row validator runs are wasted work on
+        list endpoints.
+        """
+        return CallResponse.model_construct(
             id=row["id"],
             agent_id=row["agent_id"],
             retell_call_id=row.get("retell_call_id"),
@@ -401,13 +435,13 @@ class CallService:
             load_number=row["load_number"],
             origin=row.get("origin"),
             destination=row.get("destination"),
-            status=CallStatus(row["status"]),
+            status=_STATUS_LOOKUP[row["status"]],
             duration_seconds=row.get("duration_seconds"),
             transcript=row.get("transcript"),
             recording_url=row.get("recording_url"),
-            created_at=datetime.fromisoformat(row["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(row["updated_at"].replace("Z", "+00:00")),
-            ended_at=datetime.fromisoformat(row["ended_at"].replace("Z", "+00:00")) if row.get("ended_at") else None,
+            created_at=_parse_db_datetime(row["created_at"]),
+            updated_at=_parse_db_datetime(row["updated_at"]),
+            ended_at=_parse_db_datetime(row["ended_at"]) if row.get("ended_at") else None,
             results=None,  # Will be populated separately
         )
 
@@ -454,7 +488,7 @@ class CallService:
                 new_status = local_call.status
 
             # Update call record
-            now = datetime.utcnow().isoformat()
+            now = datetime.now(timezone.utc).isoformat()
             update_data = {
                 "status": new_status.value,
                 "transcript": retell_data.get("transcript"),
@@ -466,22 +500,25 @@ class CallService:
             if new_status in [CallStatus.COMPLETED, CallStatus.FAILED]:
                 update_data["ended_at"] = now
 
-            self.db.table(Tables.CALLS).update(update_data).eq("id", local_call.id).execute()
+            self._t_calls.update(update_data).eq("id", local_call.id).execute()
 
             logger.info(f"Updated call {local_call.id} with Retell data")
 
-            # Process transcript if available and call ended
+            # Process transcript if available and call ended.
+            # Runs as a background task so the sync (and any webhook driving it)
+            # returns right after the DB update instead of waiting on LLM extraction.
             if retell_data.get("transcript") and new_status == CallStatus.COMPLETED:
-                try:
-                    await self.process_call_completion(
+                task = asyncio.create_task(
+                    self.process_call_completion(
                         call_id=local_call.id,
                         transcript=retell_data["transcript"],
                         recording_url=retell_data.get("recording_url"),
                         duration_seconds=duration_seconds
                     )
-                    logger.info(f"Processed transcript for call {local_call.id}")
-                except Exception as e:
-                    logger.error(f"Failed to process transcript: {e}")
+                )
+                self._completion_tasks.add(task)
+                task.add_done_callback(self._on_completion_task_done)
+                logger.info(f"Scheduled transcript processing for call {local_call.id}")
 
             # Return updated call
             return await self.get_call(local_call.id)
@@ -490,30 +527,71 @@ class CallService:
             logger.error(f"Failed to sync call from Retell: {e}")
             raise
 
+    async def sync_calls_from_retell(
+            self,
+            retell_call_ids: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Sync multiple calls from Retell concurrently.
+
+        Useful for cron/backfill catch-up: fires all upstream fetches at once
+        via asyncio.gather instead of N sequential round-trips.
+
+        Args:
+            retell_call_ids: Retell call IDs to sync
+
+        Returns:
+            Dict with synced call responses and per-id errors
+        """
+        outcomes = await asyncio.gather(
+            *(self.sync_call_from_retell(call_id) for call_id in retell_call_ids),
+            return_exceptions=True,
+        )
+
+        synced: Dict[str, Optional[CallResponse]] = {}
+        errors: Dict[str, str] = {}
+        for retell_call_id, outcome in zip(retell_call_ids, outcomes):
+            if isinstance(outcome, Exception):
+                errors[retell_call_id] = str(outcome)
+            else:
+                synced[retell_call_id] = outcome
+
+        if errors:
+            logger.error(f"Failed to sync {len(errors)} of {len(retell_call_ids)} calls from Retell")
+
+        return {"synced": synced, "errors": errors}
+
+    def _on_completion_task_done(self, task: "asyncio.Task") -> None:
+        """Release the task reference and surface exceptions in the logs."""
+        self._completion_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Failed to process transcript: {task.exception()}")
+
     def _map_results_to_response(self, row: dict) -> CallResultsResponse:
-        """Map database row to call results response."""
-        from app.schemas.call import CallOutcome, DriverStatus, EmergencyType
-        
+        """Map database row to call results response.
+
+        Uses model_construct with precomputed enum lookups; see
+        _map_to_response for rationale.
+        """
         # Handle old invalid call_outcome values gracefully
         call_outcome_str = row.get("call_outcome", "Unknown")
-        try:
-            call_outcome = CallOutcome(call_outcome_str)
-        except ValueError:
+        call_outcome = _OUTCOME_LOOKUP.get(call_outcome_str)
+        if call_outcome is None:
             logger.warning(f"Invalid call_outcome '{call_outcome_str}', using Unknown")
             call_outcome = CallOutcome.UNKNOWN  # Fallback to Unknown
 
-        return CallResultsResponse(
+        return CallResultsResponse.model_construct(
             id=row["id"],
             call_id=row["call_id"],
             call_outcome=call_outcome,
             is_emergency=row.get("is_emergency", False),
-            driver_status=DriverStatus(row["driver_status"]) if row.get("driver_status") else None,
+            driver_status=_DRIVER_STATUS_LOOKUP[row["driver_status"]] if row.get("driver_status") else None,
             current_location=row.get("current_location"),
             eta=row.get("eta"),
             delay_reason=row.get("delay_reason"),
             unloading_status=row.get("unloading_status"),
             pod_reminder_acknowledged=row.get("pod_reminder_acknowledged"),
-            emergency_type=EmergencyType(row["emergency_type"]) if row.get("emergency_type") else None,
+            emergency_type=_EMERGENCY_TYPE_LOOKUP[row["emergency_type"]] if row.get("emergency_type") else None,
             safety_status=row.get("safety_status"),
             injury_status=row.get("injury_status"),
             emergency_location=row.get("emergency_location"),
@@ -521,7 +599,8 @@ class CallService:
             escalation_status=row.get("escalation_status"),
             raw_extraction=row.get("raw_extraction"),
             confidence_score=row.get("confidence_score"),
-            created_at=datetime.fromisoformat(row["created_at"].replace("Z", "+00:00")),
+            cost_breakdown=row.get("cost_breakdown"),
+            created_at=_parse_db_datetime(row["created_at"]),
         )
 
 
@@ -1,11 +1,78 @@
 import logging
 from app.services.pipecat.session.session_manager import PipecatSessionState
 from app.schemas.call import CallResultsCreate
+from app.schemas.cost import CostBreakdown, ServiceCost
 from .cost_calculator import get_cost_calculator
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Field lists cached at import so serializing a breakdown is direct
+# attribute reads instead of pydantic's generic serializer walk
+_COST_FIELDS = tuple(CostBreakdown.model_fields)
+_SERVICE_COST_FIELDS = tuple(ServiceCost.model_fields)
+
+
+def _dump_cost_breakdown(cost_breakdown: CostBreakdown) -> Dict[str, Any]:
+    """
+    Serialize a CostBreakdown to a plain dict without pydantic's serializer.
+
+    The shape is fixed (four optional ServiceCost sections plus scalars),
+    so direct attribute reads over the cached field lists suffice.
+
+    Args:
+        cost_breakdown: Breakdown to serialize
+
+    Returns:
+        JSON-ready dictionary
+    """
+    out: Dict[str, Any] = {}
+    for field in _COST_FIELDS:
+        value = getattr(cost_breakdown, field)
+        if isinstance(value, ServiceCost):
+            value = {sf: getattr(value, sf) for sf in _SERVICE_COST_FIELDS}
+        out[field] = value
+    return out
+
+# Usage-estimate rates (per minute of speech)
+_CHARS_PER_MINUTE = 300
+_TOKENS_PER_MINUTE = 400
+_INPUT_TOKENS_PER_MINUTE = 240   # ~60% input
+_OUTPUT_TOKENS_PER_MINUTE = 160  # ~40% output
+
+
+def _resolve_usage(
+    duration_seconds: float,
+    actual_chars: int,
+    actual_input_tokens: int,
+    actual_output_tokens: int,
+) -> tuple:
+    """
+    Resolve usage metrics, estimating from duration where actuals are missing.
+
+    Pure arithmetic on plain scalars so bulk re-pricing jobs can call it in a
+    tight loop without touching session objects.
+
+    Returns:
+        (total_chars, input_tokens, output_tokens, total_tokens)
+    """
+    duration_minutes = (duration_seconds or 0) / 60
+    actual_total = actual_input_tokens + actual_output_tokens
+
+    total_chars = actual_chars if actual_chars > 0 else int(duration_minutes * _CHARS_PER_MINUTE)
+    input_tokens = (
+        actual_input_tokens if actual_input_tokens > 0
+        else int(duration_minutes * _INPUT_TOKENS_PER_MINUTE)
+    )
+    output_tokens = (
+        actual_output_tokens if actual_output_tokens > 0
+        else int(duration_minutes * _OUTPUT_TOKENS_PER_MINUTE)
+    )
+    total_tokens = actual_total if actual_total > 0 else int(duration_minutes * _TOKENS_PER_MINUTE)
+
+    return total_chars, input_tokens, output_tokens, total_tokens
+
+
 class CostService:
     def __init__(self):
         self.cost_calculator = get_cost_calculator()
@@ -23,23 +90,18 @@ class CostService:
         Returns:
             Cost breakdown dictionary
         """
-        logger.info(f"[CALL_COMPLETION] Calculating cost breakdown")
-        
-        # Calculate estimates if actual metrics not available
-        duration_minutes = (session.duration_seconds or 0) / 60
-        estimated_chars = int(duration_minutes * 300)  # ~300 chars per minute of speech
-        estimated_total_tokens = int(duration_minutes * 400)  # ~400 tokens per minute
-        estimated_input_tokens = int(duration_minutes * 240)  # ~60% input
-        estimated_output_tokens = int(duration_minutes * 160)  # ~40% output
-        
-        # Use actual values or estimates
-        total_chars = session.total_chars_spoken or estimated_chars
-        input_tokens = session.total_input_tokens or estimated_input_tokens
-        output_tokens = session.total_output_tokens or estimated_output_tokens
-        total_tokens = (session.total_input_tokens or 0) + (session.total_output_tokens or 0) or estimated_total_tokens
-        
-        logger.debug(f"[CALL_COMPLETION] Metrics - Duration: {session.duration_seconds}s, "
-                    f"Chars: {total_chars}, Tokens: {total_tokens}")
+        logger.info("[CALL_COMPLETION] Calculating cost breakdown")
+
+        # Resolve usage metrics (actuals, or duration-based estimates)
+        total_chars, input_tokens, output_tokens, total_tokens = _resolve_usage(
+            session.duration_seconds or 0,
+            session.total_chars_spoken or 0,
+            session.total_input_tokens or 0,
+            session.total_output_tokens or 0,
+        )
+
+        logger.debug("[CALL_COMPLETION] Metrics - Duration: %ss, Chars: %s, Tokens: %s",
+                     session.duration_seconds, total_chars, total_tokens)
         
         # Get cost calculator
         cost_calculator = get_cost_calculator()
@@ -60,32 +122,8 @@ class CostService:
             output_tokens=output_tokens,
         )
         
-        logger.info(f"[CALL_COMPLETION] Total cost: ${cost_breakdown.total_cost_usd:.4f}")
-        
-        return cost_breakdown.model_dump()
-        
+        logger.info("[CALL_COMPLETION] Total cost: $%.4f", cost_breakdown.total_cost_usd)
 
-    @staticmethod
-    def _merge_cost_breakdown(
-        results_data: CallResultsCreate,
-        cost_breakdown: Dict[str, Any]
-    ) -> None:
-        """
-        Merge cost breakdown into results data.
-        
-        Adds cost breakdown to the raw_extraction field for storage.
+        return _dump_cost_breakdown(cost_breakdown)
         
-        Args:
-            results_data: Results data to update (modified in place)
-            cost_breakdown: Cost breakdown to merge
-        """
-        # Get existing raw extraction or create new dict
-        existing_raw = results_data.raw_extraction or {}
-        
-        if isinstance(existing_raw, dict):
-            existing_raw["cost_breakdown"] = cost_breakdown
-        else:
-            existing_raw = {"cost_breakdown": cost_breakdown}
-        
-        results_data.raw_extraction = existing_raw
-        logger.debug(f"[CALL_COMPLETION] Merged cost breakdown into results")
\ No newline at end of file
+
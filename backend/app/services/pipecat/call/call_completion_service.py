@@ -4,9 +4,11 @@ Call Completion Service.
 Orchestrates the completion workflow for Pipecat calls,
 coordinating between database, transcript processing, and cost calculation.
 """
+import asyncio
+import functools
 import logging
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.services.cost.cost_service import CostService
 
@@ -14,11 +16,19 @@ from app.services.pipecat.session.session_manager import PipecatSessionState
 from app.services.pipecat.db.supabase_connector import get_db_connector
 from app.services.pipecat.db.models import CallUpdateData, CallResultsData, CallContext
 from app.services.pipecat.transcript.transcript_formatter import get_transcript_formatter
+from app.services.pipecat.transcript.transcript_processor import get_transcript_processor
 from app.schemas.call import CallResultsCreate, CallStatus
 from app.services.cost.cost_calculator import get_cost_calculator
 
 logger = logging.getLogger(__name__)
 
+# Hot-path constants: avoid the Enum attribute lookup on every completion
+# and pin the UTC zone object once (datetime.utcnow is deprecated in 3.12+)
+_COMPLETED = CallStatus.COMPLETED.value
+_UTC = timezone.utc
+_DEFAULT_OUTCOME = "In-Transit Update"
+_COMPLETION_WORKERS = 8
+
 
 class CallCompletionService:
     """
@@ -48,8 +58,56 @@ class CallCompletionService:
         """
         self.db_connector = get_db_connector()
         self.transcript_formatter = get_transcript_formatter()
+        self.transcript_processor = get_transcript_processor()
         self.cost_calculator = get_cost_calculator()
+        # Completion work queue; workers are spawned lazily on the running
+        # event loop the first time a completion is enqueued
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: list = []
         logger.info("[CALL_COMPLETION] Service initialized")
+
+    def enqueue_completion(self, session_id: str, session: PipecatSessionState) -> None:
+        """
+        Queue a session for background completion.
+
+        Returns immediately; the completion workflow (DB writes, LLM
+        extraction, cost calculation) runs on a small worker pool so
+        call-end handlers don't block on it and concurrent completions
+        overlap instead of serializing.
+
+        Args:
+            session_id: Session ID to complete
+            session: Session state with metrics and transcript
+        """
+        self._queue.put_nowait((session_id, session))
+        if not self._workers:
+            loop = asyncio.get_running_loop()
+            self._workers = [
+                loop.create_task(self._completion_worker(), name=f"call-completion-{i}")
+                for i in range(_COMPLETION_WORKERS)
+            ]
+
+    async def _completion_worker(self) -> None:
+        """Consume queued completions until cancelled."""
+        while True:
+            session_id, session = await self._queue.get()
+            try:
+                await self.complete_call(session_id, session)
+            except Exception as e:
+                logger.error("[CALL_COMPLETION] Worker error for session %s: %s",
+                             session_id, e, exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        """Finish queued completions and stop the workers (shutdown hook)."""
+        if not self._workers:
+            return
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
     
     async def complete_call(
         self,
@@ -74,166 +132,325 @@ class CallCompletionService:
             True if successful, False otherwise
         """
         try:
-            logger.info(f"[CALL_COMPLETION] Starting completion for session: {session_id}")
-            
-            # Step 1: Find call record
-            call_id = await self.db_connector.find_call_by_session_id(session_id)
-            if not call_id:
-                logger.warning(f"[CALL_COMPLETION] No call found for session: {session_id}")
-                return False
-            
-            logger.info(f"[CALL_COMPLETION] Found call record: {call_id}")
-            
-            # Step 2: Update call status and basic metrics
-            await self._update_call_status(call_id, session)
-            
-            # Step 3: Process and store results if call had meaningful duration
-            if session.duration_seconds and session.duration_seconds > 0:
-                await self._process_and_store_results(call_id, session)
+            logger.info("[CALL_COMPLETION] Starting completion for session: %s", session_id)
+
+            # Format the transcript and count messages once; both the status
+            # update and the extraction path need the same data
+            formatted_transcript = (
+                self.transcript_formatter.format_to_string(session.transcript)
+                if session.transcript else None
+            )
+            message_counts = (
+                self.transcript_formatter.get_message_count(session.transcript)
+                if session.transcript else None
+            )
+
+            update_data = self._build_update_data(
+                session, formatted_transcript, message_counts
+            )
+            extraction_worthwhile = self._is_extraction_worthwhile(session, message_counts)
+            has_results = bool(session.duration_seconds and session.duration_seconds > 0)
+
+            # When extraction needs call context that the session doesn't
+            # carry, it must come from the database - take the per-step
+            # path, which fetches it alongside the call id
+            if has_results and extraction_worthwhile and session.call_context is None:
+                return await self._complete_call_per_step(
+                    session_id, session, formatted_transcript,
+                    update_data, extraction_worthwhile
+                )
+
+            # Fast path: the session carries everything completion needs,
+            # so the id lookup, status update, and results upsert collapse
+            # into a single round trip via the session-keyed procedure.
+            # A results-processing failure must not lose the status update,
+            # so it degrades to a status-only write.
+            results_data = None
+            if has_results:
+                try:
+                    # The procedure resolves the real call id from the
+                    # session id; the placeholder here is never stored
+                    results_data = await self._build_results_data(
+                        session.call_id,
+                        session,
+                        formatted_transcript,
+                        extraction_worthwhile=extraction_worthwhile,
+                    )
+                except Exception as e:
+                    logger.error("[CALL_COMPLETION] Results processing failed: %s", e,
+                                 exc_info=True)
             else:
-                logger.info(f"[CALL_COMPLETION] Skipping results processing (zero duration)")
-            
-            logger.info(f"[CALL_COMPLETION] Successfully completed call: {call_id}")
-            return True
-            
+                logger.info("[CALL_COMPLETION] Skipping results processing (zero duration)")
+
+            call_row = await self.db_connector.complete_call_by_session(
+                session_id, update_data, results_data
+            )
+            if call_row:
+                logger.info("[CALL_COMPLETION] Successfully completed call: %s",
+                            call_row.get("id"))
+                return True
+
+            # RPC unavailable (migration not applied) or call not found -
+            # fall back to the per-step path, reusing the already-built
+            # results so extraction doesn't run twice
+            return await self._complete_call_per_step(
+                session_id, session, formatted_transcript,
+                update_data, extraction_worthwhile, results_data
+            )
+
         except Exception as e:
-            logger.error(f"[CALL_COMPLETION] Error completing call: {e}", exc_info=True)
+            logger.error("[CALL_COMPLETION] Error completing call: %s", e, exc_info=True)
             return False
-    
-    async def _update_call_status(
+
+    async def _complete_call_per_step(
         self,
-        call_id: str,
-        session: PipecatSessionState
-    ) -> None:
+        session_id: str,
+        session: PipecatSessionState,
+        formatted_transcript: Optional[str],
+        update_data: CallUpdateData,
+        extraction_worthwhile: bool,
+        results_data: Optional[CallResultsCreate] = None
+    ) -> bool:
         """
-        Update call status and basic metrics.
-        
+        Complete a call with individual database operations.
+
+        Used when the session-keyed procedure is unavailable or when
+        extraction needs call context that must be fetched by call id.
+
+        Args:
+            session_id: Session ID to complete
+            session: Session state with metrics and transcript
+            formatted_transcript: Pre-formatted transcript string, if any
+            update_data: Pre-built call status update
+            extraction_worthwhile: Whether extraction should run
+            results_data: Pre-built results to reuse, if already computed
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # One SELECT returns both the id and the context columns, and the
+        # context is memoized on the session so neither extraction nor a
+        # retry of this path refetches the same row
+        call_record = await self.db_connector.find_call_record_by_session_id(session_id)
+        if not call_record:
+            logger.warning("[CALL_COMPLETION] No call found for session: %s", session_id)
+            return False
+
+        call_id = call_record["id"]
+        logger.debug("[CALL_COMPLETION] Found call record: %s", call_id)
+
+        if session.call_context is None:
+            session.call_context = CallContext(
+                driver_name=call_record.get("driver_name"),
+                load_number=call_record.get("load_number"),
+                origin=call_record.get("origin"),
+                destination=call_record.get("destination"),
+            )
+
+        has_results = bool(
+            results_data is not None
+            or (session.duration_seconds and session.duration_seconds > 0)
+        )
+
+        if results_data is None and has_results:
+            try:
+                results_data = await self._build_results_data(
+                    call_id,
+                    session,
+                    formatted_transcript,
+                    extraction_worthwhile=extraction_worthwhile,
+                )
+            except Exception as e:
+                logger.error("[CALL_COMPLETION] Results processing failed: %s", e,
+                             exc_info=True)
+                results_data = None
+
+        if results_data is not None:
+            results_data.call_id = call_id
+            success = await self.db_connector.complete_call_atomic(
+                call_id, update_data, results_data
+            )
+        else:
+            success = await self.db_connector.update_call(call_id, update_data)
+
+        if not success:
+            logger.error("[CALL_COMPLETION] Failed to store completion for call: %s", call_id)
+            return False
+
+        logger.info("[CALL_COMPLETION] Successfully completed call: %s", call_id)
+        return True
+
+    def _build_update_data(
+        self,
+        session: PipecatSessionState,
+        formatted_transcript: Optional[str] = None,
+        message_counts: Optional[dict] = None
+    ) -> CallUpdateData:
+        """
+        Build call status update data from session state.
+
         Args:
-            call_id: Call record ID
             session: Session state with metrics
+            formatted_transcript: Pre-formatted transcript string, if any
+            message_counts: Pre-computed per-role message counts, if any
+
+        Returns:
+            CallUpdateData ready for the database write
         """
-        logger.info(f"[CALL_COMPLETION] Updating call status: {call_id}")
-        
+        now = datetime.now(_UTC)
+
         # Prepare update data
         update_data = CallUpdateData(
-            status=CallStatus.COMPLETED.value,
-            ended_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            status=_COMPLETED,
+            ended_at=now,
+            updated_at=now,
             duration_seconds=int(session.duration_seconds) if session.duration_seconds else None,
-            transcript=None  # Will be set if transcript exists
+            transcript=formatted_transcript or None
         )
-        
-        # Format and add transcript if available
-        if session.transcript and len(session.transcript) > 0:
-            transcript_text = self.transcript_formatter.format_to_string(session.transcript)
-            update_data.transcript = transcript_text
-            
-            message_counts = self.transcript_formatter.get_message_count(session.transcript)
-            logger.info(f"[CALL_COMPLETION] Transcript: {message_counts['total']} messages "
-                       f"({message_counts['user']} user, {message_counts['assistant']} assistant)")
-        
-        # Update database
-        success = await self.db_connector.update_call(call_id, update_data)
-        
-        if success:
-            logger.info(f"[CALL_COMPLETION] Successfully updated call status: {call_id}")
-        else:
-            logger.error(f"[CALL_COMPLETION] Failed to update call status: {call_id}")
-    
-    async def _process_and_store_results(
+
+        if formatted_transcript:
+            if message_counts is None:
+                message_counts = self.transcript_formatter.get_message_count(session.transcript)
+            logger.info("[CALL_COMPLETION] Transcript: %s messages (%s user, %s assistant)",
+                        message_counts['total'], message_counts['user'], message_counts['assistant'])
+
+        return update_data
+
+    @staticmethod
+    def _is_extraction_worthwhile(
+        session: PipecatSessionState,
+        message_counts: Optional[dict]
+    ) -> bool:
+        """
+        Decide whether a transcript has enough substance to justify an LLM
+        extraction round trip.
+
+        Short or one-sided transcripts (no user turns, bot greeting only)
+        carry nothing extractable - the common case for abandoned calls.
+
+        Args:
+            session: Session state with transcript
+            message_counts: Pre-computed per-role message counts, if any
+
+        Returns:
+            True if extraction should run
+        """
+        if not message_counts:
+            return False
+        if message_counts.get("user", 0) < 1 or message_counts.get("total", 0) < 2:
+            return False
+        content_chars = sum(len(msg.get("content", "")) for msg in session.transcript)
+        return content_chars >= 40
+
+    async def _build_results_data(
         self,
         call_id: str,
-        session: PipecatSessionState
-    ) -> None:
+        session: PipecatSessionState,
+        formatted_transcript: Optional[str] = None,
+        extraction_worthwhile: bool = True
+    ) -> CallResultsCreate:
         """
-        Process transcript and store structured results with cost breakdown.
-        
+        Process transcript into structured results with cost breakdown.
+
         Args:
             call_id: Call record ID
             session: Session state with transcript and metrics
+            formatted_transcript: Pre-formatted transcript string, if any
+            extraction_worthwhile: Whether the transcript justifies an LLM
+                extraction; defaults are used when False
+
+        Returns:
+            Results data with merged cost breakdown
         """
-        try:
-            logger.info(f"[CALL_COMPLETION] Processing results for call: {call_id}")
-            
-            # Step 1: Extract structured data from transcript
-            results_data = await self._extract_structured_data(call_id, session)
-            
-            # Step 2: Calculate cost breakdown
-            cost_breakdown = CostService._calculate_cost_breakdown(session)
-            
-            # Step 3: Merge cost breakdown into results
-            CostService._merge_cost_breakdown(results_data, cost_breakdown)
-            
-            # Step 4: Store in database
-            success = await self.db_connector.upsert_call_results(results_data)
-            
-            if success:
-                logger.info(f"[CALL_COMPLETION] Successfully stored results: {call_id}")
-            else:
-                logger.error(f"[CALL_COMPLETION] Failed to store results: {call_id}")
-            
-        except Exception as e:
-            logger.error(f"[CALL_COMPLETION] Error processing results: {e}", exc_info=True)
+        logger.debug("[CALL_COMPLETION] Processing results for call: %s", call_id)
+
+        # Step 1: Kick off the network-bound LLM extraction, unless the
+        # transcript is too thin to carry anything extractable
+        extraction_task = None
+        if extraction_worthwhile:
+            extraction_task = asyncio.create_task(
+                self._extract_structured_data(call_id, session, formatted_transcript)
+            )
+        else:
+            logger.info("[CALL_COMPLETION] Skipping LLM extraction (transcript too short)")
+
+        # Step 2: Calculate cost breakdown - pure CPU work that hides
+        # under the extraction wait
+        cost_breakdown = CostService._calculate_cost_breakdown(session)
+
+        results_data = (
+            await extraction_task if extraction_task is not None
+            else self._get_default_results(call_id)
+        )
+
+        # Step 3: Attach cost breakdown (dedicated field, not nested into
+        # raw_extraction, so cost queries hit an indexed column)
+        results_data.cost_breakdown = cost_breakdown
+
+        return results_data
     
     async def _extract_structured_data(
         self,
         call_id: str,
-        session: PipecatSessionState
+        session: PipecatSessionState,
+        formatted_transcript: Optional[str] = None
     ) -> CallResultsCreate:
         """
         Extract structured information from transcript.
-        
+
         Uses the transcript processor service to extract structured data
         like driver status, location, ETA, etc.
-        
+
         Args:
             call_id: Call record ID
             session: Session state with transcript
-            
+            formatted_transcript: Pre-formatted transcript string, if any
+
         Returns:
             CallResultsData with extracted information
         """
         # Return default results if no transcript
-        if not session.transcript or len(session.transcript) == 0:
-            logger.info(f"[CALL_COMPLETION] No transcript available for extraction")
+        if not session.transcript:
+            logger.info("[CALL_COMPLETION] No transcript available for extraction")
             return self._get_default_results(call_id)
         
         try:
-            from app.services.pipecat.transcript.transcript_processor import get_transcript_processor
-            
-            # Get call details for context
-            call_record = await self.db_connector.get_call_by_id(call_id)
-            
-            if not call_record:
-                logger.warning(f"[CALL_COMPLETION] Could not fetch call details")
-                return self._get_default_results(call_id)
-            
-            # Build call context
-            call_context = CallContext(
-                driver_name=call_record.driver_name,
-                load_number=call_record.load_number,
-                origin=call_record.origin,
-                destination=call_record.destination,
-            )
-            
-            # Format transcript for processor
-            transcript_text = self.transcript_formatter.format_to_string(session.transcript)
-            
+            # Prefer the context captured at call start; fall back to a DB
+            # fetch only when the session doesn't carry it
+            call_context = session.call_context
+            if call_context is None:
+                call_record = await self.db_connector.get_call_by_id(call_id)
+
+                if not call_record:
+                    logger.warning("[CALL_COMPLETION] Could not fetch call details")
+                    return self._get_default_results(call_id)
+
+                call_context = CallContext(
+                    driver_name=call_record.driver_name,
+                    load_number=call_record.load_number,
+                    origin=call_record.origin,
+                    destination=call_record.destination,
+                )
+
+            # Use the pre-formatted transcript when the caller supplied one
+            transcript_text = formatted_transcript or \
+                self.transcript_formatter.format_to_string(session.transcript)
+
+
             # Extract structured data using transcript processor
-            logger.info(f"[CALL_COMPLETION] Extracting structured data from transcript")
-            processor = get_transcript_processor()
-            extracted_results = await processor.process_call_transcript(
+            logger.debug("[CALL_COMPLETION] Extracting structured data from transcript")
+            extracted_results = await self.transcript_processor.process_call_transcript(
                 call_id=call_id,
                 transcript=transcript_text,
-                call_context=call_context.model_dump()
+                call_context=call_context
             )
             
             # Exclude call_id from extracted_results since we're passing it explicitly
-            logger.info(f"[CALL_COMPLETION] Successfully extracted structured data")
+            logger.debug("[CALL_COMPLETION] Successfully extracted structured data")
             return extracted_results
             
         except Exception as e:
-            logger.warning(f"[CALL_COMPLETION] Failed to extract data: {e}")
+            logger.warning("[CALL_COMPLETION] Failed to extract data: %s", e)
             return self._get_default_results(call_id)
     
     def _get_default_results(self, call_id: str) -> CallResultsData:
@@ -246,25 +463,24 @@ class CallCompletionService:
         Returns:
             CallResultsData with default values
         """
-        return CallResultsData(
+        # Hardcoded constants need no validation; model_construct skips
+        # the full pydantic pipeline on this fallback path
+        return CallResultsData.model_construct(
             call_id=call_id,
-            call_outcome="In-Transit Update",
+            call_outcome=_DEFAULT_OUTCOME,
             is_emergency=False,
         )
 
 
-# Singleton instance
-_call_completion_service: Optional[CallCompletionService] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_call_completion_service() -> CallCompletionService:
     """
     Get or create the CallCompletionService singleton.
-    
+
+    lru_cache makes construction race-free under concurrent first calls
+    and turns repeat lookups into a C-level cache hit.
+
     Returns:
         Singleton instance of CallCompletionService
     """
-    global _call_completion_service
-    if _call_completion_service is None:
-        _call_completion_service = CallCompletionService()
-    return _call_completion_service
+    return CallCompletionService()
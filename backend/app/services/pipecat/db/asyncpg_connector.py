@@ -0,0 +1,580 @@
+"""
+Asyncpg Database Connector Implementation.
+
+Concrete implementation of DBConnector that talks to Supabase's Postgres
+directly over a pooled asyncpg connection instead of the synchronous
+PostgREST client. Removes the REST hop and the event-loop stalls of the
+sync client on the completion hot path.
+"""
+import json
+import logging
+from typing import Optional, Dict, Any, List, Sequence
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover - optional dependency
+    asyncpg = None
+
+from app.core.config import settings
+from .db_connector import DBConnector
+from .models import (
+    CallUpdateData,
+    CallResultsData,
+    CallRecord,
+    CALL_SUMMARY_LIST_ADAPTER,
+)
+
+logger = logging.getLogger(__name__)
+
+# Columns written by the call_results upsert, mirroring the
+# complete_pipecat_call stored procedure
+_RESULTS_CONFLICT_KEY = "call_id"
+
+
+def _filter_conditions(
+    filters: Optional[Dict[str, Any]], params: List[Any]
+) -> List[str]:
+    """
+    Build SQL filter conditions, appending their values to params.
+
+    List/tuple values become a single = ANY(...) clause instead of
+    chained equality conditions.
+
+    Args:
+        filters: Optional equality filters
+        params: Parameter list to extend in place
+
+    Returns:
+        List of SQL condition strings
+    """
+    conditions = []
+    if filters:
+        for key, value in filters.items():
+            if isinstance(value, (list, tuple)):
+                params.append(list(value))
+                conditions.append(f"{key} = ANY(${len(params)})")
+            else:
+                params.append(value)
+                conditions.append(f"{key} = ${len(params)}")
+    return conditions
+
+
+async def _init_connection(conn: "asyncpg.Connection") -> None:
+    """Register JSON codecs so dicts map to jsonb columns transparently."""
+    await conn.set_type_codec(
+        "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+    )
+    await conn.set_type_codec(
+        "json", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+    )
+
+
+class AsyncpgDBConnector(DBConnector):
+    """
+    Asyncpg implementation of the DBConnector interface.
+
+    Issues parameterized SQL over a shared connection pool, giving true
+    async concurrency (no blocking REST calls) and connection reuse.
+
+    Responsibilities:
+    - Execute CRUD operations directly against Postgres
+    - Manage the connection pool lifecycle
+    - Convert rows to the same Pydantic models as the REST connector
+    """
+
+    def __init__(self):
+        """
+        Initialize the asyncpg connector.
+
+        The pool itself is created lazily on the running event loop the
+        first time a query is issued.
+        """
+        self._dsn = settings.supabase_db_url
+        self._pool: Optional["asyncpg.Pool"] = None
+        logger.info("[ASYNCPG_CONNECTOR] Initialized")
+
+    async def _get_pool(self) -> "asyncpg.Pool":
+        """
+        Get or lazily create the shared connection pool.
+
+        Returns:
+            Connection pool sized for a small worker process
+        """
+        if self._pool is None:
+            # statement_cache_size=0 keeps prepared statements off the
+            # Supabase transaction pooler (port 6543), which can hand a
+            # connection to a different backend between statements
+            self._pool = await asyncpg.create_pool(
+                dsn=self._dsn,
+                min_size=10,
+                max_size=50,
+                max_inactive_connection_lifetime=300,
+                statement_cache_size=0,
+                init=_init_connection,
+            )
+        return self._pool
+
+    async def close(self) -> None:
+        """Close the connection pool (called on application shutdown)."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def find_call_by_session_id(self, session_id: str) -> Optional[str]:
+        """
+        Find call ID by session ID.
+
+        Args:
+            session_id: Session ID to search for
+
+        Returns:
+            Call ID if found, None otherwise
+        """
+        try:
+            pool = await self._get_pool()
+            call_id = await pool.fetchval(
+                "SELECT id FROM calls WHERE retell_call_id = $1", session_id
+            )
+            if call_id is not None:
+                return str(call_id)
+
+            logger.warning(f"[ASYNCPG_CONNECTOR] No call found for session_id: {session_id}")
+            return None
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error finding call: {e}", exc_info=True)
+            return None
+
+    async def find_call_record_by_session_id(
+        self, session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find call ID and context columns by session ID in one query.
+
+        Args:
+            session_id: Session ID to search for
+
+        Returns:
+            Dict with id and context columns if found, None otherwise
+        """
+        try:
+            pool = await self._get_pool()
+            row = await pool.fetchrow(
+                "SELECT id, driver_name, load_number, origin, destination "
+                "FROM calls WHERE retell_call_id = $1",
+                session_id,
+            )
+            if row is None:
+                logger.warning(f"[ASYNCPG_CONNECTOR] No call found for session_id: {session_id}")
+                return None
+            record = dict(row)
+            record["id"] = str(record["id"])
+            return record
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error finding call record: {e}", exc_info=True)
+            return None
+
+    async def get_call_by_id(self, call_id: str) -> Optional[CallRecord]:
+        """
+        Retrieve call record by ID.
+
+        Args:
+            call_id: Call record ID
+
+        Returns:
+            CallRecord if found, None otherwise
+        """
+        try:
+            pool = await self._get_pool()
+            row = await pool.fetchrow("SELECT * FROM calls WHERE id = $1", call_id)
+            if row is None:
+                logger.warning(f"[ASYNCPG_CONNECTOR] Call not found: {call_id}")
+                return None
+            return CallRecord(**{k: str(v) if k == "id" else v for k, v in dict(row).items()})
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error fetching call: {e}", exc_info=True)
+            return None
+
+    async def get_call_with_results(
+        self, call_id: str
+    ) -> tuple:
+        """
+        Retrieve a call record and its results in one round trip.
+
+        Joins call_results server-side and returns both rows as JSON so
+        the read path costs a single query.
+
+        Args:
+            call_id: Call record ID
+
+        Returns:
+            (CallRecord or None, results dict or None) tuple
+        """
+        try:
+            pool = await self._get_pool()
+            row = await pool.fetchrow(
+                "SELECT row_to_json(c) AS call, row_to_json(r) AS results "
+                "FROM calls c LEFT JOIN call_results r ON r.call_id = c.id "
+                "WHERE c.id = $1",
+                call_id,
+            )
+            if row is None:
+                logger.warning(f"[ASYNCPG_CONNECTOR] Call not found: {call_id}")
+                return None, None
+
+            call_data = row["call"]
+            call_data["id"] = str(call_data["id"])
+            return CallRecord(**call_data), row["results"]
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error fetching call with results: {e}",
+                         exc_info=True)
+            return None, None
+
+    async def update_call(self, call_id: str, update_data: CallUpdateData) -> bool:
+        """
+        Update call record with new data.
+
+        Args:
+            call_id: Call record ID to update
+            update_data: Pydantic model with update data
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            update_dict = update_data.model_dump(exclude_none=True)
+            if not update_dict:
+                return True
+
+            assignments = ", ".join(
+                f"{column} = ${index}"
+                for index, column in enumerate(update_dict, start=2)
+            )
+            pool = await self._get_pool()
+            await pool.execute(
+                f"UPDATE calls SET {assignments} WHERE id = $1",
+                call_id,
+                *update_dict.values(),
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error updating call: {e}", exc_info=True)
+            return False
+
+    async def complete_call_by_session(
+        self,
+        session_id: str,
+        update_data: CallUpdateData,
+        results_data: Optional[CallResultsData] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Complete a call keyed by session ID in a single round trip.
+
+        Delegates to the complete_pipecat_call_by_session stored procedure
+        so the lookup, update, and upsert share one transaction.
+
+        Args:
+            session_id: Session ID identifying the call
+            update_data: Data to update on the call record
+            results_data: Results data to upsert, if any
+
+        Returns:
+            Call context dict if completed, None otherwise
+        """
+        try:
+            pool = await self._get_pool()
+            row = await pool.fetchval(
+                "SELECT complete_pipecat_call_by_session($1, $2::jsonb, $3::jsonb)",
+                session_id,
+                update_data.model_dump(mode="json", exclude_none=True),
+                results_data.model_dump(mode="json", exclude_none=True)
+                if results_data is not None else None,
+            )
+            if row:
+                return row
+
+            logger.warning(f"[ASYNCPG_CONNECTOR] No call found for session_id: {session_id}")
+            return None
+
+        except Exception as e:
+            logger.warning(
+                f"[ASYNCPG_CONNECTOR] Session-keyed completion failed ({e}), "
+                f"caller should fall back to per-step writes"
+            )
+            return None
+
+    async def complete_call_atomic(
+        self,
+        call_id: str,
+        update_data: CallUpdateData,
+        results_data: CallResultsData
+    ) -> bool:
+        """
+        Store a call status update and its results in one batched write.
+
+        Args:
+            call_id: Call record ID to update
+            update_data: Data to update on the call record
+            results_data: Results data to upsert
+
+        Returns:
+            True if both writes succeeded, False otherwise
+        """
+        try:
+            pool = await self._get_pool()
+            await pool.execute(
+                "SELECT complete_pipecat_call($1, $2::jsonb, $3::jsonb)",
+                call_id,
+                update_data.model_dump(mode="json", exclude_none=True),
+                results_data.model_dump(mode="json", exclude_none=True),
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(
+                f"[ASYNCPG_CONNECTOR] Atomic completion failed ({e}), "
+                f"falling back to sequential writes"
+            )
+            updated = await self.update_call(call_id, update_data)
+            upserted = await self.upsert_call_results(results_data)
+            return updated and upserted
+
+    async def upsert_call_results(self, results_data: CallResultsData) -> bool:
+        """
+        Insert or update call results.
+
+        Args:
+            results_data: Pydantic model with results data
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            results_dict = results_data.model_dump(exclude_none=True)
+            columns = list(results_dict)
+            placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+            updates = ", ".join(
+                f"{column} = EXCLUDED.{column}"
+                for column in columns
+                if column != _RESULTS_CONFLICT_KEY
+            )
+            pool = await self._get_pool()
+            await pool.execute(
+                f"INSERT INTO call_results ({', '.join(columns)}) "
+                f"VALUES ({placeholders}) "
+                f"ON CONFLICT ({_RESULTS_CONFLICT_KEY}) DO UPDATE SET {updates}",
+                *results_dict.values(),
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error upserting results: {e}", exc_info=True)
+            return False
+
+    async def upsert_call_results_batch(
+        self, results_batch: List[CallResultsData]
+    ) -> bool:
+        """
+        Insert or update several call results in one write.
+
+        Uses executemany over uniform columns so a burst of completions
+        shares one prepared statement and transaction.
+
+        Args:
+            results_batch: Results to upsert together
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Full dumps (Nones included) keep the column list uniform
+            # across rows, as executemany requires
+            rows = [results_data.model_dump() for results_data in results_batch]
+            columns = list(rows[0])
+            placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+            updates = ", ".join(
+                f"{column} = EXCLUDED.{column}"
+                for column in columns
+                if column != _RESULTS_CONFLICT_KEY
+            )
+            pool = await self._get_pool()
+            await pool.executemany(
+                f"INSERT INTO call_results ({', '.join(columns)}) "
+                f"VALUES ({placeholders}) "
+                f"ON CONFLICT ({_RESULTS_CONFLICT_KEY}) DO UPDATE SET {updates}",
+                [tuple(row.values()) for row in rows],
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error upserting results batch: {e}",
+                         exc_info=True)
+            return False
+
+    async def get_call_results(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve call results by call ID.
+
+        Args:
+            call_id: Call record ID
+
+        Returns:
+            Results dictionary if found, None otherwise
+        """
+        try:
+            pool = await self._get_pool()
+            row = await pool.fetchrow(
+                "SELECT * FROM call_results WHERE call_id = $1", call_id
+            )
+            if row is None:
+                logger.warning(f"[ASYNCPG_CONNECTOR] No results found for call: {call_id}")
+                return None
+            return dict(row)
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error fetching results: {e}", exc_info=True)
+            return None
+
+    async def delete_call(self, call_id: str) -> bool:
+        """
+        Delete a call record and its results in one transaction.
+
+        Args:
+            call_id: Call record ID to delete
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        "DELETE FROM call_results WHERE call_id = $1", call_id
+                    )
+                    await conn.execute("DELETE FROM calls WHERE id = $1", call_id)
+            return True
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error deleting call: {e}", exc_info=True)
+            return False
+
+    async def list_calls(
+        self,
+        limit: int = 100,
+        cursor: Optional[tuple] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> tuple:
+        """
+        List call records with optional filtering, newest first.
+
+        Pages with a (created_at, id) keyset cursor via Postgres row
+        comparison, so deep pages stay O(limit).
+
+        Args:
+            limit: Maximum number of records to return
+            cursor: (created_at, id) of the last record from the previous
+                page, or None for the first page
+            filters: Optional equality filters (e.g., {"status": "completed"})
+
+        Returns:
+            (list of CallRecord, next cursor or None) tuple
+        """
+        try:
+            params: List[Any] = []
+            conditions = _filter_conditions(filters, params)
+
+            if cursor is not None:
+                last_created_at, last_id = cursor
+                params.extend([last_created_at, last_id])
+                conditions.append(
+                    f"(created_at, id) < (${len(params) - 1}::timestamptz, ${len(params)}::uuid)"
+                )
+
+            where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+            params.append(limit)
+
+            pool = await self._get_pool()
+            rows = await pool.fetch(
+                f"SELECT * FROM calls {where}"
+                f"ORDER BY created_at DESC, id DESC LIMIT ${len(params)}",
+                *params,
+            )
+            calls = [
+                CallRecord(**{k: str(v) if k == "id" else v for k, v in dict(row).items()})
+                for row in rows
+            ]
+
+            next_cursor = None
+            if rows and len(rows) == limit:
+                next_cursor = (rows[-1]["created_at"], str(rows[-1]["id"]))
+
+            return calls, next_cursor
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error listing calls: {e}", exc_info=True)
+            return [], None
+
+    async def list_call_summaries(
+        self,
+        limit: int = 100,
+        cursor: Optional[tuple] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Sequence[str] = ("id", "status", "created_at"),
+    ) -> tuple:
+        """
+        List lightweight call summaries for list views.
+
+        Selects only the requested columns (id/created_at are always
+        included for the cursor) and validates the whole page in one
+        TypeAdapter pass.
+
+        Args:
+            limit: Maximum number of records to return
+            cursor: (created_at, id) keyset cursor, or None
+            filters: Optional equality filters (e.g., {"status": "completed"})
+            columns: Columns to select
+
+        Returns:
+            (list of CallSummary, next cursor or None) tuple
+        """
+        try:
+            select_columns = ", ".join(dict.fromkeys((*columns, "id", "created_at")))
+
+            params: List[Any] = []
+            conditions = _filter_conditions(filters, params)
+
+            if cursor is not None:
+                last_created_at, last_id = cursor
+                params.extend([last_created_at, last_id])
+                conditions.append(
+                    f"(created_at, id) < (${len(params) - 1}::timestamptz, ${len(params)}::uuid)"
+                )
+
+            where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+            params.append(limit)
+
+            pool = await self._get_pool()
+            rows = await pool.fetch(
+                f"SELECT {select_columns} FROM calls {where}"
+                f"ORDER BY created_at DESC, id DESC LIMIT ${len(params)}",
+                *params,
+            )
+            summaries = CALL_SUMMARY_LIST_ADAPTER.validate_python(
+                [{**dict(row), "id": str(row["id"])} for row in rows]
+            )
+
+            next_cursor = None
+            if rows and len(rows) == limit:
+                next_cursor = (rows[-1]["created_at"], str(rows[-1]["id"]))
+
+            return summaries, next_cursor
+
+        except Exception as e:
+            logger.error(f"[ASYNCPG_CONNECTOR] Error listing call summaries: {e}",
+                         exc_info=True)
+            return [], None
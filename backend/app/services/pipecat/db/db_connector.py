@@ -5,8 +5,8 @@ Defines the abstract interface for database operations
 following the Dependency Inversion Principle (DIP).
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
-from .models import CallUpdateData, CallResultsData, CallRecord
+from typing import Optional, Dict, Any, List, Sequence
+from .models import CallUpdateData, CallResultsData, CallRecord, CallSummary
 
 
 class DBConnector(ABC):
@@ -48,6 +48,27 @@ class DBConnector(ABC):
         """
         pass
     
+    async def get_call_with_results(
+        self, call_id: str
+    ) -> tuple:
+        """
+        Retrieve a call record and its results together.
+
+        Default implementation issues the two single-entity reads;
+        connectors that can join server-side override this so both come
+        back in one round trip.
+
+        Args:
+            call_id: Call record ID
+
+        Returns:
+            (CallRecord or None, results dict or None) tuple
+        """
+        call_record = await self.get_call_by_id(call_id)
+        if call_record is None:
+            return None, None
+        return call_record, await self.get_call_results(call_id)
+
     @abstractmethod
     async def update_call(self, call_id: str, update_data: CallUpdateData) -> bool:
         """
@@ -62,6 +83,97 @@ class DBConnector(ABC):
         """
         pass
     
+    @abstractmethod
+    async def find_call_record_by_session_id(
+        self, session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find call ID and context columns by session ID in one query.
+
+        Returns the id together with driver_name, load_number, origin and
+        destination so callers that need extraction context don't issue a
+        second SELECT for the same row.
+
+        Args:
+            session_id: Session ID to search for
+
+        Returns:
+            Dict with id and context columns if found, None otherwise
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release any pooled resources held by the connector.
+
+        No-op by default; pool-backed implementations override this and
+        it is awaited on application shutdown.
+        """
+
+    @abstractmethod
+    async def complete_call_by_session(
+        self,
+        session_id: str,
+        update_data: CallUpdateData,
+        results_data: Optional[CallResultsData] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Complete a call keyed by session ID in a single round trip.
+
+        Folds the session-id lookup, the status update, and the optional
+        results upsert into one database operation.
+
+        Args:
+            session_id: Session ID identifying the call
+            update_data: Data to update on the call record
+            results_data: Results data to upsert, if any
+
+        Returns:
+            Call context dict if completed, None if the call was not
+            found or the operation is unavailable
+        """
+        pass
+
+    @abstractmethod
+    async def complete_call_atomic(
+        self,
+        call_id: str,
+        update_data: CallUpdateData,
+        results_data: CallResultsData
+    ) -> bool:
+        """
+        Store a call status update and its results in one batched write.
+
+        Args:
+            call_id: Call record ID to update
+            update_data: Data to update on the call record
+            results_data: Results data to upsert
+
+        Returns:
+            True if both writes succeeded, False otherwise
+        """
+        pass
+
+    async def upsert_call_results_batch(
+        self, results_batch: List[CallResultsData]
+    ) -> bool:
+        """
+        Insert or update several call results in one write.
+
+        Default implementation falls back to per-row upserts; connectors
+        with multi-row support override this.
+
+        Args:
+            results_batch: Results to upsert together
+
+        Returns:
+            True if all writes succeeded, False otherwise
+        """
+        success = True
+        for results_data in results_batch:
+            success = await self.upsert_call_results(results_data) and success
+        return success
+
     @abstractmethod
     async def upsert_call_results(self, results_data: CallResultsData) -> bool:
         """
@@ -105,18 +217,56 @@ class DBConnector(ABC):
     async def list_calls(
         self,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[tuple] = None,
         filters: Optional[Dict[str, Any]] = None
-    ) -> List[CallRecord]:
+    ) -> tuple:
         """
-        List call records with optional filtering.
-        
+        List call records with optional filtering, newest first.
+
+        Pages with a (created_at, id) keyset cursor so page cost does not
+        grow with page depth the way LIMIT/OFFSET does.
+
         Args:
             limit: Maximum number of records to return
-            offset: Number of records to skip
+            cursor: (created_at, id) of the last record from the previous
+                page, or None for the first page
             filters: Optional filters to apply
-            
+
         Returns:
-            List of CallRecord objects
+            (list of CallRecord, next cursor or None) tuple
         """
         pass
+
+    async def list_call_summaries(
+        self,
+        limit: int = 100,
+        cursor: Optional[tuple] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Sequence[str] = ("id", "status", "created_at"),
+    ) -> tuple:
+        """
+        List lightweight call summaries for list views.
+
+        Default implementation projects full list_calls rows; connectors
+        override it to select only the requested columns so list pages
+        don't pay full-row transfer and validation cost.
+
+        Args:
+            limit: Maximum number of records to return
+            cursor: Keyset cursor from the previous page, or None
+            filters: Optional filters to apply
+            columns: Columns to select
+
+        Returns:
+            (list of CallSummary, next cursor or None) tuple
+        """
+        calls, next_cursor = await self.list_calls(
+            limit=limit, cursor=cursor, filters=filters
+        )
+        summaries = [
+            CallSummary.model_construct(
+                id=call.id, status=call.status, created_at=call.created_at
+            )
+            for call in calls
+        ]
+        return summaries, next_cursor
@@ -6,14 +6,14 @@ in the Pipecat service layer.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from enum import Enum
 
 
 class CallUpdateData(BaseModel):
     """
     Data model for updating call records.
-    
+
     Used when updating call status, duration, and transcript
     after a Pipecat session completes.
     """
@@ -22,10 +22,9 @@ class CallUpdateData(BaseModel):
     updated_at: datetime = Field(..., description="Timestamp of last update")
     duration_seconds: Optional[int] = Field(None, description="Call duration in seconds")
     transcript: Optional[str] = Field(None, description="Formatted transcript text")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "completed",
                 "ended_at": "2024-01-08T12:00:00Z",
@@ -34,6 +33,7 @@ class CallUpdateData(BaseModel):
                 "transcript": "USER: Hello\n\nASSISTANT: Hi, how can I help?"
             }
         }
+    )
 
 class EmergencyType(str, Enum):
     """Types of emergencies."""
@@ -45,7 +45,7 @@ class EmergencyType(str, Enum):
 class CallResultsData(BaseModel):
     """
     Data model for call results with extracted information.
-    
+
     Stores structured data extracted from transcripts,
     including outcomes, driver status, and cost breakdowns.
     """
@@ -58,18 +58,17 @@ class CallResultsData(BaseModel):
     delay_reason: Optional[str] = Field(None, description="Reason for delay if any")
     emergency_type: Optional[str] = Field(None, description="Type of emergency if applicable")
     confidence_score: Optional[float] = Field(None, description="Confidence in extraction")
-    raw_extraction: Optional[Dict[str, Any]] = Field(None, description="Raw extraction data including cost")
-    emergency_type: EmergencyType = EmergencyType.OTHER
+    raw_extraction: Optional[Dict[str, Any]] = Field(None, description="Raw extraction data")
+    cost_breakdown: Optional[Dict[str, Any]] = Field(None, description="Cost breakdown for the call")
     safety_status: Optional[str] = None
     injury_status: Optional[str] = None
     emergency_location: Optional[str] = None
     load_secure: Optional[bool] = None
     escalation_status: str = "Pending"
     pod_reminder_acknowledged: bool = False
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "call_id": "call_123",
                 "call_outcome": "In-Transit Update",
@@ -78,20 +77,21 @@ class CallResultsData(BaseModel):
                 "current_location": "I-95 near Baltimore",
                 "eta": "2 hours",
                 "confidence_score": 0.95,
-                "raw_extraction": {
-                    "cost_breakdown": {
-                        "total_cost_usd": 0.025
-                    }
+                "cost_breakdown": {
+                    "total_cost_usd": 0.025
                 }
             }
         }
+    )
 
 
 class CallRecord(BaseModel):
     """
     Data model for call record retrieved from database.
-    
+
     Represents a call record with all associated metadata.
+    Read-only DTO: rows are never mutated after hydration, so the
+    model is frozen.
     """
     id: str = Field(..., description="Call record ID")
     agent_id: str = Field(..., description="Agent ID used for the call")
@@ -101,10 +101,10 @@ class CallRecord(BaseModel):
     destination: Optional[str] = Field(None, description="Destination location")
     status: str = Field(..., description="Current call status")
     created_at: datetime = Field(..., description="When call was created")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "call_123",
                 "agent_id": "agent_456",
@@ -116,12 +116,44 @@ class CallRecord(BaseModel):
                 "created_at": "2024-01-08T11:00:00Z"
             }
         }
+    )
+
+
+class CallSummary(BaseModel):
+    """
+    Lightweight projection of a call record for list views.
+
+    Carries only the columns a list endpoint actually renders, so list
+    queries can select a narrow column set instead of hydrating full
+    CallRecord rows.
+    """
+    id: str = Field(..., description="Call record ID")
+    status: Optional[str] = Field(None, description="Current call status")
+    created_at: Optional[datetime] = Field(None, description="When call was created")
+    duration_seconds: Optional[int] = Field(None, description="Call duration in seconds")
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "id": "call_123",
+                "status": "completed",
+                "created_at": "2024-01-08T11:00:00Z",
+                "duration_seconds": 120
+            }
+        }
+    )
+
+
+# Validates a whole page of summary rows in one C-core pass, which is
+# noticeably faster than per-row model construction on large lists
+CALL_SUMMARY_LIST_ADAPTER = TypeAdapter(List[CallSummary])
 
 
 class CallContext(BaseModel):
     """
     Context information for a call.
-    
+
     Used for providing context to transcript processing
     and extraction services.
     """
@@ -129,10 +161,10 @@ class CallContext(BaseModel):
     load_number: Optional[str] = Field(None, description="Load/shipment number")
     origin: Optional[str] = Field(None, description="Origin location")
     destination: Optional[str] = Field(None, description="Destination location")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "driver_name": "John Doe",
                 "load_number": "LOAD-789",
@@ -140,25 +172,27 @@ class CallContext(BaseModel):
                 "destination": "Houston, TX"
             }
         }
+    )
 
 
 class TranscriptMessage(BaseModel):
     """
     A single message in a conversation transcript.
-    
+
     Represents one turn in the conversation between
     user and assistant.
     """
     role: str = Field(..., description="Message role: 'user' or 'assistant'")
     content: str = Field(..., description="Message content")
     timestamp: Optional[datetime] = Field(None, description="When message was captured")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "role": "user",
                 "content": "I'm about 30 minutes out",
                 "timestamp": "2024-01-08T11:05:00Z"
             }
         }
+    )
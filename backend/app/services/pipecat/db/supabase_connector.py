@@ -4,16 +4,95 @@ Supabase Database Connector Implementation.
 Concrete implementation of DBConnector interface for Supabase database.
 Handles all Supabase-specific database operations.
 """
+import asyncio
+import functools
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, List, Sequence
 
+from app.core.config import settings
 from app.db.database import get_supabase_client, Tables
 from .db_connector import DBConnector
-from .models import CallUpdateData, CallResultsData, CallRecord
+from .models import (
+    CallUpdateData,
+    CallResultsData,
+    CallRecord,
+    CALL_SUMMARY_LIST_ADAPTER,
+)
 
 logger = logging.getLogger(__name__)
 
+# Lookup-cache tuning: entries live for 5 minutes and each cache is
+# capped so a long-running process can't grow without bound
+_CACHE_TTL = 300.0
+_CACHE_MAX_ENTRIES = 1024
+
+# Results-upsert micro-batching: writes arriving within the window are
+# coalesced into one multi-row upsert, bounded in size so a sustained
+# burst still flushes promptly
+_UPSERT_BATCH_WINDOW = 0.02
+_UPSERT_BATCH_MAX = 50
+
+
+def _cache_get(cache: Dict[str, tuple], key: str):
+    """
+    Get a live entry from a TTL cache, dropping it if expired.
+
+    Args:
+        cache: Cache mapping key -> (value, inserted_at)
+        key: Cache key
+
+    Returns:
+        Cached value, or None on miss/expiry
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    value, inserted_at = entry
+    if time.monotonic() - inserted_at >= _CACHE_TTL:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _apply_filters(query, filters: Optional[Dict[str, Any]]):
+    """
+    Apply equality filters to a query builder.
+
+    List/tuple values become a single IN clause server-side instead of
+    chained equality conditions.
+
+    Args:
+        query: PostgREST query builder
+        filters: Optional filters to apply
+
+    Returns:
+        Query builder with filters applied
+    """
+    if filters:
+        for key, value in filters.items():
+            if isinstance(value, (list, tuple)):
+                query = query.in_(key, list(value))
+            else:
+                query = query.eq(key, value)
+    return query
+
+
+def _cache_put(cache: Dict[str, tuple], key: str, value) -> None:
+    """
+    Insert into a TTL cache, evicting the oldest entry when full.
+
+    Args:
+        cache: Cache mapping key -> (value, inserted_at)
+        key: Cache key
+        value: Value to store
+    """
+    if len(cache) >= _CACHE_MAX_ENTRIES:
+        # Dicts iterate in insertion order, so the first key is oldest
+        cache.pop(next(iter(cache)), None)
+    cache[key] = (value, time.monotonic())
+
 
 class SupabaseDBConnector(DBConnector):
     """
@@ -37,8 +116,59 @@ class SupabaseDBConnector(DBConnector):
         Gets the Supabase client instance for database operations.
         """
         self.db = get_supabase_client()
+        # The supabase-py client is synchronous; a bounded pool keeps its
+        # blocking HTTP calls off the event loop so concurrent completions
+        # don't serialize behind each other
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="supabase")
+        # session_id -> call_id never changes for the lifetime of a call,
+        # and call rows only change through this connector, so short-TTL
+        # caches are sound and save a full HTTP round trip per hit
+        self._session_cache: Dict[str, tuple] = {}
+        self._call_cache: Dict[str, tuple] = {}
+        # Bounds concurrent requests at the app boundary so burst load
+        # queues here instead of overwhelming the Supabase pooler
+        self._concurrency_limit = settings.db_concurrency_limit
+        self._sem = asyncio.Semaphore(self._concurrency_limit)
+        # Results upserts are micro-batched: completions landing in the
+        # same window share one multi-row write instead of a round trip
+        # each; callers await a future resolved by the drain task
+        self._results_queue: asyncio.Queue = asyncio.Queue()
+        self._results_worker: Optional[asyncio.Task] = None
         logger.info("[SUPABASE_CONNECTOR] Initialized")
-    
+
+    async def _run(self, func: Callable):
+        """
+        Execute a blocking client call on the shared thread pool.
+
+        Gated by the concurrency semaphore so at most
+        db_concurrency_limit requests are in flight at once.
+
+        Args:
+            func: Zero-argument callable issuing the blocking request
+
+        Returns:
+            Whatever the callable returns
+        """
+        async with self._sem:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report concurrency-gate utilization for monitoring.
+
+        Returns:
+            Dict with the configured limit and requests currently in flight
+        """
+        in_flight = self._concurrency_limit - self._sem._value
+        return {
+            "concurrency_limit": self._concurrency_limit,
+            "in_flight": in_flight,
+        }
+
+    async def close(self) -> None:
+        """Shut down the request thread pool (called on application shutdown)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     async def find_call_by_session_id(self, session_id: str) -> Optional[str]:
         """
         Find call ID by session ID.
@@ -52,26 +182,61 @@ class SupabaseDBConnector(DBConnector):
         Returns:
             Call ID if found, None otherwise
         """
+        cached = _cache_get(self._session_cache, session_id)
+        if cached is not None:
+            return cached
+
         try:
-            logger.debug(f"[SUPABASE_CONNECTOR] Finding call with session_id: {session_id}")
-            
-            result = self.db.table(Tables.CALLS)\
+            logger.debug("[SUPABASE_CONNECTOR] Finding call with session_id: %s", session_id)
+
+            query = self.db.table(Tables.CALLS)\
                 .select("id")\
-                .eq("retell_call_id", session_id)\
-                .execute()
-            
+                .eq("retell_call_id", session_id)
+            result = await self._run(query.execute)
+
             if result.data and len(result.data) > 0:
                 call_id = result.data[0]["id"]
-                logger.info(f"[SUPABASE_CONNECTOR] Found call ID: {call_id}")
+                logger.info("[SUPABASE_CONNECTOR] Found call ID: %s", call_id)
+                _cache_put(self._session_cache, session_id, call_id)
                 return call_id
             
-            logger.warning(f"[SUPABASE_CONNECTOR] No call found for session_id: {session_id}")
+            logger.warning("[SUPABASE_CONNECTOR] No call found for session_id: %s", session_id)
             return None
             
         except Exception as e:
-            logger.error(f"[SUPABASE_CONNECTOR] Error finding call: {e}", exc_info=True)
+            logger.error("[SUPABASE_CONNECTOR] Error finding call: %s", e, exc_info=True)
             return None
     
+    async def find_call_record_by_session_id(
+        self, session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find call ID and context columns by session ID in one query.
+
+        Args:
+            session_id: Session ID to search for
+
+        Returns:
+            Dict with id and context columns if found, None otherwise
+        """
+        try:
+            logger.debug("[SUPABASE_CONNECTOR] Finding call record for session_id: %s", session_id)
+
+            query = self.db.table(Tables.CALLS)\
+                .select("id, driver_name, load_number, origin, destination")\
+                .eq("retell_call_id", session_id)
+            result = await self._run(query.execute)
+
+            if result.data and len(result.data) > 0:
+                return result.data[0]
+
+            logger.warning("[SUPABASE_CONNECTOR] No call found for session_id: %s", session_id)
+            return None
+
+        except Exception as e:
+            logger.error("[SUPABASE_CONNECTOR] Error finding call record: %s", e, exc_info=True)
+            return None
+
     async def get_call_by_id(self, call_id: str) -> Optional[CallRecord]:
         """
         Retrieve call record by ID.
@@ -82,28 +247,76 @@ class SupabaseDBConnector(DBConnector):
         Returns:
             CallRecord if found, None otherwise
         """
+        cached = _cache_get(self._call_cache, call_id)
+        if cached is not None:
+            return cached
+
         try:
-            logger.debug(f"[SUPABASE_CONNECTOR] Fetching call: {call_id}")
-            
-            result = self.db.table(Tables.CALLS)\
+            logger.debug("[SUPABASE_CONNECTOR] Fetching call: %s", call_id)
+
+            query = self.db.table(Tables.CALLS)\
                 .select("*")\
-                .eq("id", call_id)\
-                .execute()
-            
+                .eq("id", call_id)
+            result = await self._run(query.execute)
+
             if result.data and len(result.data) > 0:
                 call_data = result.data[0]
-                logger.info(f"[SUPABASE_CONNECTOR] Retrieved call: {call_id}")
-                
-                # Convert to Pydantic model
-                return CallRecord(**call_data)
+                logger.info("[SUPABASE_CONNECTOR] Retrieved call: %s", call_id)
+
+                # Convert to Pydantic model (frozen, so safe to cache)
+                call_record = CallRecord(**call_data)
+                _cache_put(self._call_cache, call_id, call_record)
+                return call_record
             
-            logger.warning(f"[SUPABASE_CONNECTOR] Call not found: {call_id}")
+            logger.warning("[SUPABASE_CONNECTOR] Call not found: %s", call_id)
             return None
             
         except Exception as e:
-            logger.error(f"[SUPABASE_CONNECTOR] Error fetching call: {e}", exc_info=True)
+            logger.error("[SUPABASE_CONNECTOR] Error fetching call: %s", e, exc_info=True)
             return None
     
+    async def get_call_with_results(
+        self, call_id: str
+    ) -> tuple:
+        """
+        Retrieve a call record and its results in one round trip.
+
+        Uses a PostgREST embedded resource select (call_results joined
+        server-side), so callers that need both stop paying two HTTP
+        round trips on the read path.
+
+        Args:
+            call_id: Call record ID
+
+        Returns:
+            (CallRecord or None, results dict or None) tuple
+        """
+        try:
+            logger.debug("[SUPABASE_CONNECTOR] Fetching call with results: %s", call_id)
+
+            query = self.db.table(Tables.CALLS)\
+                .select("*, call_results(*)")\
+                .eq("id", call_id)
+            result = await self._run(query.execute)
+
+            if not result.data:
+                logger.warning("[SUPABASE_CONNECTOR] Call not found: %s", call_id)
+                return None, None
+
+            call_data = dict(result.data[0])
+            embedded = call_data.pop("call_results", None)
+            # PostgREST embeds to-many relations as a list
+            if isinstance(embedded, list):
+                embedded = embedded[0] if embedded else None
+
+            logger.info("[SUPABASE_CONNECTOR] Retrieved call with results: %s", call_id)
+            return CallRecord(**call_data), embedded
+
+        except Exception as e:
+            logger.error("[SUPABASE_CONNECTOR] Error fetching call with results: %s", e,
+                         exc_info=True)
+            return None, None
+
     async def update_call(self, call_id: str, update_data: CallUpdateData) -> bool:
         """
         Update call record with new data.
@@ -116,64 +329,286 @@ class SupabaseDBConnector(DBConnector):
             True if successful, False otherwise
         """
         try:
-            logger.info(f"[SUPABASE_CONNECTOR] Updating call: {call_id}")
-            
-            # Convert Pydantic model to dict, excluding None values
-            update_dict = update_data.model_dump(exclude_none=True)
-            
-            # Convert datetime objects to ISO format strings
-            for key, value in update_dict.items():
-                if isinstance(value, datetime):
-                    update_dict[key] = value.isoformat()
+            logger.info("[SUPABASE_CONNECTOR] Updating call: %s", call_id)
             
-            logger.debug(f"[SUPABASE_CONNECTOR] Update fields: {list(update_dict.keys())}")
-            
-            # Execute update
-            result = self.db.table(Tables.CALLS)\
-                .update(update_dict)\
-                .eq("id", call_id)\
-                .execute()
-            
-            logger.info(f"[SUPABASE_CONNECTOR] Successfully updated call: {call_id}")
+            # mode="json" renders datetimes to ISO strings inside
+            # pydantic's C core, replacing the per-field Python loop
+            update_dict = update_data.model_dump(mode="json", exclude_none=True)
+
+            # Gate: building the key list has a cost even when DEBUG is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SUPABASE_CONNECTOR] Update fields: %s", list(update_dict.keys()))
+            
+            # Execute update; return=minimal skips serializing the row
+            # back over the wire since only success matters here
+            query = self.db.table(Tables.CALLS)\
+                .update(update_dict, returning="minimal")\
+                .eq("id", call_id)
+            result = await self._run(query.execute)
+
+            # The cached row is stale now; drop it so the next read refetches
+            self._call_cache.pop(call_id, None)
+
+            logger.info("[SUPABASE_CONNECTOR] Successfully updated call: %s", call_id)
             return True
             
         except Exception as e:
-            logger.error(f"[SUPABASE_CONNECTOR] Error updating call: {e}", exc_info=True)
+            logger.error("[SUPABASE_CONNECTOR] Error updating call: %s", e, exc_info=True)
             return False
     
+    async def complete_call_by_session(
+        self,
+        session_id: str,
+        update_data: CallUpdateData,
+        results_data: Optional[CallResultsData] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Complete a call keyed by session ID in a single round trip.
+
+        Calls the complete_pipecat_call_by_session stored procedure
+        (migration 005), which folds the session-id lookup, the status
+        update, and the optional results upsert into one transaction and
+        returns the call row context (id, driver_name, load_number,
+        origin, destination).
+
+        Args:
+            session_id: Session ID identifying the call
+            update_data: Data to update on the call record
+            results_data: Results data to upsert, if any
+
+        Returns:
+            Call context dict if the call was found and completed,
+            None if the call was not found or the RPC is unavailable
+        """
+        try:
+            logger.info("[SUPABASE_CONNECTOR] Completing call by session: %s", session_id)
+
+            query = self.db.rpc(
+                "complete_pipecat_call_by_session",
+                {
+                    "p_session_id": session_id,
+                    "p_update": update_data.model_dump(mode="json", exclude_none=True),
+                    "p_results": results_data.model_dump(mode="json", exclude_none=True)
+                    if results_data is not None else None,
+                },
+            )
+            result = await self._run(query.execute)
+
+            if result.data:
+                self._call_cache.pop(result.data.get("id"), None)
+                logger.info(
+                    "[SUPABASE_CONNECTOR] Completed call %s for session: %s",
+                    result.data.get("id"),
+                    session_id,
+                )
+                return result.data
+
+            logger.warning("[SUPABASE_CONNECTOR] No call found for session_id: %s", session_id)
+            return None
+
+        except Exception as e:
+            logger.warning(
+                "[SUPABASE_CONNECTOR] Session-keyed completion failed (%s), "
+                "caller should fall back to per-step writes",
+                e,
+            )
+            return None
+
+    async def complete_call_atomic(
+        self,
+        call_id: str,
+        update_data: CallUpdateData,
+        results_data: CallResultsData
+    ) -> bool:
+        """
+        Store a call status update and its results in one batched write.
+
+        Calls the complete_pipecat_call stored procedure (migration 003) so
+        both writes run in one transaction over a single round trip. Falls
+        back to the two sequential writes if the RPC is unavailable (e.g.
+        migration not yet applied).
+
+        Args:
+            call_id: Call record ID to update
+            update_data: Data to update on the call record
+            results_data: Results data to upsert
+
+        Returns:
+            True if both writes succeeded, False otherwise
+        """
+        try:
+            logger.info("[SUPABASE_CONNECTOR] Completing call atomically: %s", call_id)
+
+            query = self.db.rpc(
+                "complete_pipecat_call",
+                {
+                    "p_call_id": call_id,
+                    "p_update": update_data.model_dump(mode="json", exclude_none=True),
+                    "p_results": results_data.model_dump(mode="json", exclude_none=True),
+                },
+            )
+            await self._run(query.execute)
+
+            self._call_cache.pop(call_id, None)
+            logger.info("[SUPABASE_CONNECTOR] Successfully completed call atomically: %s", call_id)
+            return True
+
+        except Exception as e:
+            logger.warning(
+                "[SUPABASE_CONNECTOR] Atomic completion failed (%s), "
+                "falling back to sequential writes",
+                e,
+            )
+            updated = await self.update_call(call_id, update_data)
+            upserted = await self.upsert_call_results(results_data)
+            return updated and upserted
+
     async def upsert_call_results(self, results_data: CallResultsData) -> bool:
         """
         Insert or update call results.
-        
-        Uses Supabase's upsert functionality to insert new results
-        or update existing ones based on call_id.
-        
+
+        The row is queued and a drain task coalesces everything arriving
+        within the batching window into one multi-row upsert, so bursts
+        of concurrent completions share a single round trip. Conflicts
+        resolve on call_id (uq_call_results_call_id) so a re-completed
+        call updates its row instead of failing on the unique index.
+
         Args:
             results_data: Pydantic model with results data
-            
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            logger.info(f"[SUPABASE_CONNECTOR] Upserting call results for: {results_data.call_id}")
-            
+            logger.info("[SUPABASE_CONNECTOR] Upserting call results for: %s", results_data.call_id)
+
             # Convert Pydantic model to dict, excluding None values
-            results_dict = results_data.model_dump(exclude_none=True)
-            
-            logger.debug(f"[SUPABASE_CONNECTOR] Results fields: {list(results_dict.keys())}")
-            
-            # Execute upsert
-            result = self.db.table(Tables.CALL_RESULTS)\
-                .upsert(results_dict)\
-                .execute()
-            
-            logger.info(f"[SUPABASE_CONNECTOR] Successfully upserted call results: {results_data.call_id}")
+            results_dict = results_data.model_dump(mode="json", exclude_none=True)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SUPABASE_CONNECTOR] Results fields: %s", list(results_dict.keys()))
+
+            future = asyncio.get_running_loop().create_future()
+            self._results_queue.put_nowait((results_dict, future))
+            if self._results_worker is None or self._results_worker.done():
+                self._results_worker = asyncio.create_task(
+                    self._drain_results_queue(), name="results-upsert-batcher"
+                )
+            await future
+
+            logger.info("[SUPABASE_CONNECTOR] Successfully upserted call results: %s", results_data.call_id)
             return True
-            
+
         except Exception as e:
-            logger.error(f"[SUPABASE_CONNECTOR] Error upserting results: {e}", exc_info=True)
+            logger.error("[SUPABASE_CONNECTOR] Error upserting results: %s", e, exc_info=True)
             return False
-    
+
+    async def _drain_results_queue(self) -> None:
+        """Drain queued results into batched upserts until the queue empties."""
+        while not self._results_queue.empty():
+            results_dict, future = self._results_queue.get_nowait()
+            rows = [results_dict]
+            futures = [future]
+            deadline = asyncio.get_running_loop().time() + _UPSERT_BATCH_WINDOW
+
+            while len(rows) < _UPSERT_BATCH_MAX:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    results_dict, future = await asyncio.wait_for(
+                        self._results_queue.get(), timeout
+                    )
+                except asyncio.TimeoutError:
+                    break
+                rows.append(results_dict)
+                futures.append(future)
+
+            await self._flush_results_batch(rows, futures)
+
+    async def _upsert_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Issue one results upsert, conflicting on call_id.
+
+        Args:
+            rows: Result row dicts to write together
+        """
+        query = self.db.table(Tables.CALL_RESULTS)\
+            .upsert(rows, on_conflict="call_id", returning="minimal")
+        await self._run(query.execute)
+
+    async def _flush_results_batch(self, rows: List[Dict[str, Any]], futures: List[asyncio.Future]) -> None:
+        """
+        Write one batch and resolve its callers' futures.
+
+        A failed multi-row write falls back to per-row upserts so one
+        bad row doesn't reject the whole burst.
+
+        Args:
+            rows: Result row dicts collected for this batch
+            futures: Caller futures, parallel to rows
+        """
+        try:
+            await self._upsert_rows(rows)
+            if len(rows) > 1:
+                logger.debug("[SUPABASE_CONNECTOR] Coalesced %s results upserts", len(rows))
+            for fut in futures:
+                if not fut.done():
+                    fut.set_result(True)
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                if not futures[0].done():
+                    futures[0].set_exception(e)
+                return
+            logger.warning(
+                "[SUPABASE_CONNECTOR] Batched results upsert failed (%s), retrying per row", e
+            )
+
+        for row, fut in zip(rows, futures):
+            try:
+                await self._upsert_rows([row])
+                if not fut.done():
+                    fut.set_result(True)
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+
+
+    async def upsert_call_results_batch(
+        self, results_batch: List[CallResultsData]
+    ) -> bool:
+        """
+        Insert or update several call results in one write.
+
+        PostgREST accepts array payloads, so a whole burst of completions
+        costs a single round trip.
+
+        Args:
+            results_batch: Results to upsert together
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            logger.info("[SUPABASE_CONNECTOR] Upserting %s call results", len(results_batch))
+
+            rows = [
+                results_data.model_dump(mode="json", exclude_none=True)
+                for results_data in results_batch
+            ]
+            await self._run(
+                self.db.table(Tables.CALL_RESULTS)
+                .upsert(rows, on_conflict="call_id", returning="minimal")
+                .execute
+            )
+            return True
+
+        except Exception as e:
+            logger.error("[SUPABASE_CONNECTOR] Error upserting results batch: %s", e,
+                         exc_info=True)
+            return False
+
     async def get_call_results(self, call_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve call results by call ID.
@@ -185,110 +620,204 @@ class SupabaseDBConnector(DBConnector):
             Results dictionary if found, None otherwise
         """
         try:
-            logger.debug(f"[SUPABASE_CONNECTOR] Fetching call results: {call_id}")
+            logger.debug("[SUPABASE_CONNECTOR] Fetching call results: %s", call_id)
             
-            result = self.db.table(Tables.CALL_RESULTS)\
+            query = self.db.table(Tables.CALL_RESULTS)\
                 .select("*")\
-                .eq("call_id", call_id)\
-                .execute()
+                .eq("call_id", call_id)
+            result = await self._run(query.execute)
             
             if result.data and len(result.data) > 0:
-                logger.info(f"[SUPABASE_CONNECTOR] Retrieved call results: {call_id}")
+                logger.info("[SUPABASE_CONNECTOR] Retrieved call results: %s", call_id)
                 return result.data[0]
             
-            logger.warning(f"[SUPABASE_CONNECTOR] No results found for call: {call_id}")
+            logger.warning("[SUPABASE_CONNECTOR] No results found for call: %s", call_id)
             return None
             
         except Exception as e:
-            logger.error(f"[SUPABASE_CONNECTOR] Error fetching results: {e}", exc_info=True)
+            logger.error("[SUPABASE_CONNECTOR] Error fetching results: %s", e, exc_info=True)
             return None
     
     async def delete_call(self, call_id: str) -> bool:
         """
         Delete a call record.
-        
+
+        Calls the delete_call_cascade stored procedure (migration 006) so
+        the results row and the call record go in one round trip. Falls
+        back to the two sequential deletes if the RPC is unavailable.
+
         Args:
             call_id: Call record ID to delete
-            
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            logger.info(f"[SUPABASE_CONNECTOR] Deleting call: {call_id}")
-            
-            # Delete call results first (foreign key constraint)
-            self.db.table(Tables.CALL_RESULTS)\
-                .delete()\
-                .eq("call_id", call_id)\
-                .execute()
-            
-            # Delete call record
-            result = self.db.table(Tables.CALLS)\
-                .delete()\
-                .eq("id", call_id)\
-                .execute()
-            
-            logger.info(f"[SUPABASE_CONNECTOR] Successfully deleted call: {call_id}")
+            logger.info("[SUPABASE_CONNECTOR] Deleting call: %s", call_id)
+
+            try:
+                await self._run(
+                    self.db.rpc("delete_call_cascade", {"p_call_id": call_id}).execute
+                )
+            except Exception as rpc_error:
+                logger.warning(
+                    f"[SUPABASE_CONNECTOR] Cascade delete failed ({rpc_error}), "
+                    f"falling back to sequential deletes"
+                )
+                # Delete call results first (foreign key constraint)
+                await self._run(
+                    self.db.table(Tables.CALL_RESULTS)
+                    .delete(returning="minimal")
+                    .eq("call_id", call_id)
+                    .execute
+                )
+                await self._run(
+                    self.db.table(Tables.CALLS)
+                    .delete(returning="minimal")
+                    .eq("id", call_id)
+                    .execute
+                )
+
+            # Drop the row and any session mapping that resolved to it
+            self._call_cache.pop(call_id, None)
+            for session_id in [
+                key for key, (value, _) in self._session_cache.items()
+                if value == call_id
+            ]:
+                self._session_cache.pop(session_id, None)
+
+            logger.info("[SUPABASE_CONNECTOR] Successfully deleted call: %s", call_id)
             return True
             
         except Exception as e:
-            logger.error(f"[SUPABASE_CONNECTOR] Error deleting call: {e}", exc_info=True)
+            logger.error("[SUPABASE_CONNECTOR] Error deleting call: %s", e, exc_info=True)
             return False
     
     async def list_calls(
         self,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[tuple] = None,
         filters: Optional[Dict[str, Any]] = None
-    ) -> List[CallRecord]:
+    ) -> tuple:
         """
-        List call records with optional filtering.
-        
+        List call records with optional filtering, newest first.
+
+        Pages with a (created_at, id) keyset cursor rather than
+        LIMIT/OFFSET, so deep pages stay O(limit) instead of scanning and
+        discarding offset rows.
+
         Args:
             limit: Maximum number of records to return
-            offset: Number of records to skip
+            cursor: (created_at, id) of the last record from the previous
+                page, or None for the first page
             filters: Optional filters to apply (e.g., {"status": "completed"})
-            
+
         Returns:
-            List of CallRecord objects
+            (list of CallRecord, next cursor or None) tuple
         """
         try:
-            logger.debug(f"[SUPABASE_CONNECTOR] Listing calls (limit={limit}, offset={offset})")
-            
+            logger.debug("[SUPABASE_CONNECTOR] Listing calls (limit=%s, cursor=%s)", limit, cursor)
+
             # Build query
-            query = self.db.table(Tables.CALLS).select("*")
-            
-            # Apply filters if provided
-            if filters:
-                for key, value in filters.items():
-                    query = query.eq(key, value)
-            
-            # Apply pagination
-            result = query.range(offset, offset + limit - 1).execute()
-            
+            query = _apply_filters(self.db.table(Tables.CALLS).select("*"), filters)
+
+            query = query.order("created_at", desc=True).order("id", desc=True)
+
+            # Keyset predicate: strictly after the last row seen
+            if cursor is not None:
+                last_created_at, last_id = cursor
+                query = query.or_(
+                    f"created_at.lt.{last_created_at},"
+                    f"and(created_at.eq.{last_created_at},id.lt.{last_id})"
+                )
+
+            result = await self._run(query.limit(limit).execute)
+
             # Convert to Pydantic models
             calls = [CallRecord(**call_data) for call_data in result.data]
-            
-            logger.info(f"[SUPABASE_CONNECTOR] Retrieved {len(calls)} calls")
-            return calls
-            
+
+            next_cursor = None
+            if result.data and len(result.data) == limit:
+                last_row = result.data[-1]
+                next_cursor = (last_row["created_at"], last_row["id"])
+
+            logger.info("[SUPABASE_CONNECTOR] Retrieved %s calls", len(calls))
+            return calls, next_cursor
+
         except Exception as e:
-            logger.error(f"[SUPABASE_CONNECTOR] Error listing calls: {e}", exc_info=True)
-            return []
+            logger.error("[SUPABASE_CONNECTOR] Error listing calls: %s", e, exc_info=True)
+            return [], None
+
+    async def list_call_summaries(
+        self,
+        limit: int = 100,
+        cursor: Optional[tuple] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Sequence[str] = ("id", "status", "created_at"),
+    ) -> tuple:
+        """
+        List lightweight call summaries for list views.
+
+        Selects only the requested columns (id/created_at are always
+        included for the cursor) and validates the whole page in one
+        TypeAdapter pass, so list endpoints don't pay full-row transfer
+        and per-row model construction.
+
+        Args:
+            limit: Maximum number of records to return
+            cursor: (created_at, id) keyset cursor, or None
+            filters: Optional filters to apply (e.g., {"status": "completed"})
+            columns: Columns to select
 
+        Returns:
+            (list of CallSummary, next cursor or None) tuple
+        """
+        try:
+            select_columns = ",".join(dict.fromkeys((*columns, "id", "created_at")))
+            query = _apply_filters(self.db.table(Tables.CALLS).select(select_columns), filters)
+
+            query = query.order("created_at", desc=True).order("id", desc=True)
+
+            if cursor is not None:
+                last_created_at, last_id = cursor
+                query = query.or_(
+                    f"created_at.lt.{last_created_at},"
+                    f"and(created_at.eq.{last_created_at},id.lt.{last_id})"
+                )
+
+            result = await self._run(query.limit(limit).execute)
+
+            summaries = CALL_SUMMARY_LIST_ADAPTER.validate_python(result.data)
 
-# Singleton instance
-_db_connector: Optional[SupabaseDBConnector] = None
+            next_cursor = None
+            if result.data and len(result.data) == limit:
+                last_row = result.data[-1]
+                next_cursor = (last_row["created_at"], last_row["id"])
 
+            return summaries, next_cursor
 
-def get_db_connector() -> SupabaseDBConnector:
+        except Exception as e:
+            logger.error("[SUPABASE_CONNECTOR] Error listing call summaries: %s", e,
+                         exc_info=True)
+            return [], None
+
+
+@functools.lru_cache(maxsize=1)
+def get_db_connector() -> DBConnector:
     """
-    Get or create the SupabaseDBConnector singleton.
-    
+    Get or create the DB connector singleton.
+
+    Prefers the pooled asyncpg connector when a direct Postgres DSN is
+    configured (SUPABASE_DB_URL) and asyncpg is installed; otherwise uses
+    the PostgREST-backed Supabase connector. lru_cache makes first-use
+    construction race-free, so concurrent callers can't each build a
+    connector (and its connection pool).
+
     Returns:
-        Singleton instance of SupabaseDBConnector
+        Singleton DBConnector instance
     """
-    global _db_connector
-    if _db_connector is None:
-        _db_connector = SupabaseDBConnector()
-    return _db_connector
+    from .asyncpg_connector import AsyncpgDBConnector, asyncpg
+
+    if settings.supabase_db_url and asyncpg is not None:
+        return AsyncpgDBConnector()
+    return SupabaseDBConnector()
@@ -12,89 +12,74 @@ from .base import validate_api_key
 
 logger = logging.getLogger(__name__)
 
-# Import Pipecat Anthropic service
-try:
-    from pipecat.services.anthropic import AnthropicLLMService
-    ANTHROPIC_AVAILABLE = True
-except ImportError as e:
-    logger.error(f"Anthropic LLM service not available: {e}")
-    ANTHROPIC_AVAILABLE = False
+# The pipecat Anthropic module pulls in the whole anthropic SDK, so it
+# is imported on first use rather than at startup and the class memoized
+# here for subsequent calls
+_anthropic_llm_service_cls = None
 
 
-class AnthropicServiceFactory:
+def _get_anthropic_llm_service_cls():
     """
-    Factory for creating Anthropic LLM service instances.
-    
-    Responsibilities:
-    - Validate Anthropic API key
-    - Extract Anthropic configuration from pipeline config
-    - Create configured Anthropic LLM service instance
-    - Log service creation details
-    
-    Supported Models:
-    - claude-3-5-sonnet-20241022: Latest Claude 3.5 Sonnet
-    - claude-3-5-haiku-20241022: Fast and efficient Claude 3.5 Haiku
-    - claude-3-opus: Most powerful Claude 3 model
-    - claude-3-sonnet: Balanced Claude 3 model
-    - claude-3-haiku: Fast Claude 3 model
-    
-    Configuration:
-    - model: Model name (e.g., "claude-3-5-sonnet-20241022")
-    - temperature: Sampling temperature (0.0 to 1.0)
-    - max_tokens: Maximum tokens to generate
+    Import and memoize the pipecat AnthropicLLMService class.
+
+    Returns:
+        AnthropicLLMService class
+
+    Raises:
+        ImportError: If Anthropic service is not available
     """
-    
-    @staticmethod
-    def create(config: PipelineConfig, api_key: str) -> Any:
-        """
-        Create an Anthropic LLM service instance.
-        
-        Args:
-            config: Pipeline configuration containing Anthropic settings
-            api_key: Anthropic API key
-            
-        Returns:
-            Configured AnthropicLLMService instance
-            
-        Raises:
-            ValueError: If API key is missing
-            ImportError: If Anthropic service is not available
-        """
-        if not ANTHROPIC_AVAILABLE:
+    global _anthropic_llm_service_cls
+    if _anthropic_llm_service_cls is None:
+        try:
+            from pipecat.services.anthropic import AnthropicLLMService
+        except ImportError as e:
+            logger.error(f"Anthropic LLM service not available: {e}")
             raise ImportError(
                 "Anthropic LLM service not available. "
                 "Install pipecat with anthropic support."
-            )
-        
-        # Validate API key
-        validate_api_key(api_key, "ANTHROPIC")
-        
-        # Extract Anthropic-specific configuration
-        anthropic_config = config.llm_config.anthropic
-        
-        logger.info(
-            f"Creating Anthropic LLM service - "
-            f"model: {anthropic_config.model}, "
-            f"temperature: {anthropic_config.temperature}"
-        )
-        
-        # Create and return Anthropic LLM service
-        return AnthropicLLMService(
-            api_key=api_key,
-            model=anthropic_config.model,
-        )
+            ) from e
+        _anthropic_llm_service_cls = AnthropicLLMService
+    return _anthropic_llm_service_cls
 
 
 def create_anthropic_llm(config: PipelineConfig, api_key: str) -> Any:
     """
-    Convenience function to create Anthropic LLM service.
-    
+    Create an Anthropic LLM service instance.
+
+    Supported Models:
+    - claude-3-5-sonnet-20241022: Latest Claude 3.5 Sonnet
+    - claude-3-5-haiku-20241022: Fast and efficient Claude 3.5 Haiku
+    - claude-3-opus: Most powerful Claude 3 model
+    - claude-3-sonnet: Balanced Claude 3 model
+    - claude-3-haiku: Fast Claude 3 model
+
     Args:
-        config: Pipeline configuration
+        config: Pipeline configuration containing Anthropic settings
         api_key: Anthropic API key
-        
+
     Returns:
         Configured AnthropicLLMService instance
+
+    Raises:
+        ValueError: If API key is missing
+        ImportError: If Anthropic service is not available
     """
-    factory = AnthropicServiceFactory()
-    return factory.create(config, api_key)
+    service_cls = _get_anthropic_llm_service_cls()
+
+    # Validate API key
+    validate_api_key(api_key, "ANTHROPIC")
+
+    # Extract Anthropic-specific configuration
+    anthropic_config = config.llm_config.anthropic
+
+    logger.info(
+        "Creating Anthropic LLM service - model: %s, temperature: %s",
+        anthropic_config.model,
+        anthropic_config.temperature,
+    )
+
+    # Create and return Anthropic LLM service
+    return service_cls(
+        api_key=api_key,
+        model=anthropic_config.model,
+    )
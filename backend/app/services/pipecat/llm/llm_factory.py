@@ -5,7 +5,7 @@ Main factory for creating Large Language Model service instances
 based on pipeline configuration.
 """
 import logging
-from typing import Any, Optional
+from typing import Any
 
 from app.schemas.pipeline import PipelineConfig, LLMService
 from app.core.config import settings
@@ -14,6 +14,14 @@ from .anthropic_service import create_anthropic_llm
 
 logger = logging.getLogger(__name__)
 
+# Provider dispatch: (create function, settings attr for the API key,
+# llm_config attr carrying the provider-specific config). O(1) lookup
+# instead of an if/elif chain per pipeline build.
+_PROVIDERS = {
+    LLMService.OPENAI: (create_openai_llm, "openai_api_key", "openai"),
+    LLMService.ANTHROPIC: (create_anthropic_llm, "anthropic_api_key", "anthropic"),
+}
+
 
 class LLMServiceFactory:
     """
@@ -32,8 +40,16 @@ class LLMServiceFactory:
     
     def __init__(self):
         """Initialize the LLM service factory."""
+        # Instances keyed by (service_type, model): rebuilding a provider
+        # client per pipeline discards its warm httpx connection pool and
+        # TLS session, so identical configurations reuse one instance
+        self._cache: dict = {}
         logger.debug("LLMServiceFactory initialized")
-    
+
+    def clear_cache(self) -> None:
+        """Drop all cached service instances (intended for tests)."""
+        self._cache.clear()
+
     def create_llm_service(self, config: PipelineConfig) -> Any:
         """
         Create an LLM service based on pipeline configuration.
@@ -56,56 +72,37 @@ class LLMServiceFactory:
             >>> llm = factory.create_llm_service(config)
         """
         service_type = config.llm_config.service
-        
-        logger.info(f"Creating LLM service: {service_type.value}")
-        
-        # Route to appropriate service factory
-        if service_type == LLMService.OPENAI:
-            return self._create_openai(config)
-        
-        elif service_type == LLMService.ANTHROPIC:
-            return self._create_anthropic(config)
-        
-        else:
+
+        provider = _PROVIDERS.get(service_type)
+        if provider is None:
             raise ValueError(f"Unsupported LLM service: {service_type}")
-    
-    def _create_openai(self, config: PipelineConfig) -> Any:
-        """
-        Create OpenAI LLM service.
-        
-        Args:
-            config: Pipeline configuration
-            
-        Returns:
-            Configured OpenAILLMService instance
-        """
-        return create_openai_llm(config, settings.openai_api_key)
-    
-    def _create_anthropic(self, config: PipelineConfig) -> Any:
-        """
-        Create Anthropic LLM service.
-        
-        Args:
-            config: Pipeline configuration
-            
-        Returns:
-            Configured AnthropicLLMService instance
-        """
-        return create_anthropic_llm(config, settings.anthropic_api_key)
 
+        create, api_key_attr, config_attr = provider
+        model = getattr(config.llm_config, config_attr).model
 
-# Singleton instance
-_llm_factory: Optional[LLMServiceFactory] = None
+        cache_key = (service_type, model)
+        service = self._cache.get(cache_key)
+        if service is not None:
+            logger.debug("Reusing cached LLM service: %s/%s", service_type.value, model)
+            return service
+
+        logger.info(f"Creating LLM service: {service_type.value}")
+
+        service = create(config, getattr(settings, api_key_attr))
+        self._cache[cache_key] = service
+        return service
+
+
+# Eager singleton: construction only initializes the instance cache, so
+# building it at import makes the accessor a plain return
+_llm_factory: LLMServiceFactory = LLMServiceFactory()
 
 
 def get_llm_service_factory() -> LLMServiceFactory:
     """
-    Get or create the LLMServiceFactory singleton.
-    
+    Get the LLMServiceFactory singleton.
+
     Returns:
         Singleton instance of LLMServiceFactory
     """
-    global _llm_factory
-    if _llm_factory is None:
-        _llm_factory = LLMServiceFactory()
     return _llm_factory
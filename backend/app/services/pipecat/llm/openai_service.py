@@ -12,88 +12,73 @@ from .base import validate_api_key
 
 logger = logging.getLogger(__name__)
 
-# Import Pipecat OpenAI service
-try:
-    from pipecat.services.openai import OpenAILLMService
-    OPENAI_AVAILABLE = True
-except ImportError as e:
-    logger.error(f"OpenAI LLM service not available: {e}")
-    OPENAI_AVAILABLE = False
+# The pipecat OpenAI module pulls in the whole openai SDK (httpx,
+# tokenizers, ...), so it is imported on first use rather than at
+# startup and the class memoized here for subsequent calls
+_openai_llm_service_cls = None
 
 
-class OpenAIServiceFactory:
+def _get_openai_llm_service_cls():
     """
-    Factory for creating OpenAI LLM service instances.
-    
-    Responsibilities:
-    - Validate OpenAI API key
-    - Extract OpenAI configuration from pipeline config
-    - Create configured OpenAI LLM service instance
-    - Log service creation details
-    
-    Supported Models:
-    - gpt-4o: Latest GPT-4 Omni model
-    - gpt-4o-mini: Smaller, faster GPT-4 Omni
-    - gpt-4-turbo: GPT-4 Turbo model
-    - gpt-3.5-turbo: GPT-3.5 Turbo model
-    
-    Configuration:
-    - model: Model name (e.g., "gpt-4o")
-    - temperature: Sampling temperature (0.0 to 2.0)
-    - max_tokens: Maximum tokens to generate (optional)
+    Import and memoize the pipecat OpenAILLMService class.
+
+    Returns:
+        OpenAILLMService class
+
+    Raises:
+        ImportError: If OpenAI service is not available
     """
-    
-    @staticmethod
-    def create(config: PipelineConfig, api_key: str) -> Any:
-        """
-        Create an OpenAI LLM service instance.
-        
-        Args:
-            config: Pipeline configuration containing OpenAI settings
-            api_key: OpenAI API key
-            
-        Returns:
-            Configured OpenAILLMService instance
-            
-        Raises:
-            ValueError: If API key is missing
-            ImportError: If OpenAI service is not available
-        """
-        if not OPENAI_AVAILABLE:
+    global _openai_llm_service_cls
+    if _openai_llm_service_cls is None:
+        try:
+            from pipecat.services.openai import OpenAILLMService
+        except ImportError as e:
+            logger.error(f"OpenAI LLM service not available: {e}")
             raise ImportError(
                 "OpenAI LLM service not available. "
                 "Install pipecat with openai support."
-            )
-        
-        # Validate API key
-        validate_api_key(api_key, "OPENAI")
-        
-        # Extract OpenAI-specific configuration
-        openai_config = config.llm_config.openai
-        
-        logger.info(
-            f"Creating OpenAI LLM service - "
-            f"model: {openai_config.model}, "
-            f"temperature: {openai_config.temperature}"
-        )
-        
-        # Create and return OpenAI LLM service
-        return OpenAILLMService(
-            api_key=api_key,
-            model=openai_config.model,
-        )
+            ) from e
+        _openai_llm_service_cls = OpenAILLMService
+    return _openai_llm_service_cls
 
 
 def create_openai_llm(config: PipelineConfig, api_key: str) -> Any:
     """
-    Convenience function to create OpenAI LLM service.
-    
+    Create an OpenAI LLM service instance.
+
+    Supported Models:
+    - gpt-4o: Latest GPT-4 Omni model
+    - gpt-4o-mini: Smaller, faster GPT-4 Omni
+    - gpt-4-turbo: GPT-4 Turbo model
+    - gpt-3.5-turbo: GPT-3.5 Turbo model
+
     Args:
-        config: Pipeline configuration
+        config: Pipeline configuration containing OpenAI settings
         api_key: OpenAI API key
-        
+
     Returns:
         Configured OpenAILLMService instance
+
+    Raises:
+        ValueError: If API key is missing
+        ImportError: If OpenAI service is not available
     """
-    factory = OpenAIServiceFactory()
-    return factory.create(config, api_key)
+    service_cls = _get_openai_llm_service_cls()
+
+    # Validate API key
+    validate_api_key(api_key, "OPENAI")
+
+    # Extract OpenAI-specific configuration
+    openai_config = config.llm_config.openai
+
+    logger.info(
+        "Creating OpenAI LLM service - model: %s, temperature: %s",
+        openai_config.model,
+        openai_config.temperature,
+    )
+
+    # Create and return OpenAI LLM service
+    return service_cls(
+        api_key=api_key,
+        model=openai_config.model,
+    )
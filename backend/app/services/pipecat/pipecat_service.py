@@ -5,15 +5,17 @@ Coordinates Pipecat call sessions while delegating all
 transport-specific behavior to transport strategies.
 """
 
+import asyncio
 import logging
-import uuid
-from typing import Optional, Dict, Any
+import secrets
+from typing import Dict, Any
 
 from app.schemas.pipeline import (
     PipelineConfig,
     PipecatCallRequest,
     TransportType,
 )
+from app.services.pipecat.db.models import CallContext
 from app.services.pipecat.session.session_manager import get_session_manager
 from app.services.pipecat.transport.webrtc.daily_room_service import get_daily_room_service
 from app.services.pipecat.utils.text_processor import get_text_processor
@@ -25,6 +27,10 @@ from app.services.pipecat.pipeline.pipeline_utils import PipecatSessionUtils
 
 logger = logging.getLogger(__name__)
 
+# Prompts above this size are filled in a worker thread to keep the
+# event loop responsive under concurrent call starts
+_PROMPT_OFFLOAD_THRESHOLD = 4096
+
 
 class PipecatService:
     """
@@ -62,27 +68,63 @@ class PipecatService:
         Start a Pipecat call using selected transport.
         """
 
-        session_id = str(uuid.uuid4())
-        logger.info(f"[SERVICE] Starting Pipecat session {session_id}")
-
-        # Fill prompt placeholders
-        system_prompt_filled = self.text_processor.replace_placeholders(
-            system_prompt,
-            request,
-        )
-
-        # Create session
+        # token_hex skips UUID's canonical formatting and yields a shorter
+        # key for the session dicts this id is hashed into on every lookup
+        session_id = secrets.token_hex(16)
+        logger.info("[SERVICE] Starting Pipecat session %s", session_id)
+
+        # Fill prompt placeholders. Small prompts are a handful of
+        # str.replace passes — cheaper inline than a thread hop — while
+        # large ones go off-loop so they can't stall other sessions and
+        # overlap with the transport's room-creation round-trip instead
+        prompt_task = None
+        if len(system_prompt) > _PROMPT_OFFLOAD_THRESHOLD:
+            prompt_task = asyncio.create_task(
+                asyncio.to_thread(
+                    self.text_processor.replace_placeholders,
+                    system_prompt,
+                    request,
+                )
+            )
+        else:
+            system_prompt = self.text_processor.replace_placeholders(
+                system_prompt,
+                request,
+            )
+
+        # Create session; driver/load context is carried on the session so
+        # call completion doesn't have to fetch it back from the database
         session = self.session_manager.create_session(
             session_id=session_id,
             call_id=request.agent_id,
             config=agent_config,
-            system_prompt=system_prompt_filled,
+            system_prompt=system_prompt,
             transport=transport,
+            call_context=CallContext(
+                driver_name=request.driver_name,
+                load_number=request.load_number,
+                origin=request.origin,
+                destination=request.destination,
+            ),
         )
 
-        # Delegate to transport strategy
+        # Delegate to transport strategy; room creation starts while the
+        # prompt task is still filling placeholders
         transport_handler = self.transport_registry.get(transport)
-        return await transport_handler.start(session)
+        start_task = asyncio.create_task(transport_handler.start(session))
+
+        try:
+            if prompt_task is not None:
+                session.system_prompt = await prompt_task
+        except BaseException:
+            start_task.cancel()
+            raise
+        finally:
+            # Always unblock the pipeline's prompt_ready.wait(); leaving it
+            # unset on a prompt failure would hang the pipeline task forever
+            session.prompt_ready.set()
+
+        return await start_task
 
     async def end_call(self, session_id: str) -> Dict[str, Any]:
         """
@@ -90,30 +132,37 @@ class PipecatService:
 
         This is part of the public service API and is used by API routes.
         """
-        logger.info(f"[SERVICE] Ending Pipecat session {session_id}")
+        logger.info("[SERVICE] Ending Pipecat session %s", session_id)
 
-        # Get session (active or completed)
-        session = self.session_manager.get_session(session_id)
+        # Single lookup resolves the session and whether it already
+        # completed, instead of probing both session dicts
+        session, is_completed = self.session_manager.lookup(session_id)
 
         if not session:
-            logger.warning(f"[SERVICE] Session {session_id} not found")
+            logger.warning("[SERVICE] Session %s not found", session_id)
             return None
 
         # If already completed, just return metrics
-        completed = self.session_manager.get_completed_session(session_id)
-        if completed:
-            return await PipecatSessionUtils.build_session_result(completed)
+        if is_completed:
+            return await PipecatSessionUtils.build_session_result(session)
 
         # Cancel running pipeline if any
         await PipecatSessionUtils.cancel_pipeline_if_running(session)
 
-        # Finalize metrics + DB update
-        if not session.duration_seconds:
-            session.calculate_duration()
-
-        if not session.metrics_saved:
-            await self.call_completion_service.complete_call(session_id, session)
-            session.metrics_saved = True
+        # Finalize metrics + DB update under the session's finalize
+        # guard: the pipeline finalizer can race this path, and the
+        # lock plus flag keeps the completion write to exactly one
+        async with session.finalize_lock:
+            if not session.finalized:
+                if not session.duration_seconds:
+                    session.calculate_duration()
+
+                # Completion (DB writes + extraction) runs on the
+                # background worker pool; the caller gets its session
+                # result immediately
+                self.call_completion_service.enqueue_completion(session_id, session)
+                session.metrics_saved = True
+                session.finalized = True
 
         # Mark session completed
         self.session_manager.mark_completed(session_id)
@@ -124,15 +173,15 @@ class PipecatService:
 # Singleton factory (MODULE LEVEL)
 # =========================
 
-_pipecat_service: Optional[PipecatService] = None
+# Eager singleton: the constructor is pure composition over other
+# singletons, so building it at import removes the unlocked
+# check-then-set race under concurrent cold-start requests
+_pipecat_service: PipecatService = PipecatService()
 
 
 def get_pipecat_service() -> PipecatService:
     """
-    Get or create the PipecatService singleton.
+    Get the PipecatService singleton.
     """
-    global _pipecat_service
-    if _pipecat_service is None:
-        _pipecat_service = PipecatService()
     return _pipecat_service
 
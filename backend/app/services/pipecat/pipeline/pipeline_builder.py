@@ -28,6 +28,11 @@ class PipelineBuilder:
     def __init__(self, pipeline_factory, transport_factory: TransportFactory):
         self.pipeline_factory = pipeline_factory
         self.transport_factory = transport_factory
+        # System-message dicts keyed by prompt: agents reuse the same
+        # prompt across many sessions, so the seed message is built once
+        # per prompt instead of per call. The dict is treated as
+        # read-only downstream; each context still gets its own list.
+        self._system_msg_cache: dict = {}
     
     def build(self, session) -> Pipeline:
         """
@@ -67,9 +72,17 @@ class PipelineBuilder:
     def _create_llm_context(self, session):
         """
         Create initial LLM context seeded with system prompt.
+
+        The context itself is per-session (it accumulates conversation
+        state), but the seed system message is cached per prompt.
         """
-        context = OpenAILLMContext(messages=[
-            {"role": "system", "content": session.system_prompt}
-        ])
+        system_msg = self._system_msg_cache.get(session.system_prompt)
+        if system_msg is None:
+            if len(self._system_msg_cache) >= 128:
+                self._system_msg_cache.clear()
+            system_msg = {"role": "system", "content": session.system_prompt}
+            self._system_msg_cache[session.system_prompt] = system_msg
+
+        context = OpenAILLMContext(messages=[system_msg])
         logger.info("[PIPELINE] LLM context created")
         return context
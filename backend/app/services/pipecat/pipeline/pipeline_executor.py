@@ -17,9 +17,20 @@ class PipelineExecutor:
     Executes a pipeline using PipelineRunner.
     """
 
-    async def run(self, pipeline, session) -> None:
+    def __init__(self):
+        # One runner serves every session: PipelineRunner tracks each
+        # running task independently, and constructing it per session
+        # repeated its setup (signal handling) on every call. Built on
+        # first use so construction happens under a running event loop
+        # rather than at import.
+        self._runner = None
+
+    def start(self, pipeline, session) -> asyncio.Task:
         """
-        Run a pipeline and wait for completion.
+        Submit a pipeline for execution and return its task.
+
+        Submission and join are decoupled so callers that are already
+        running inside their own task don't pay an extra wrapping layer.
         """
         task = PipelineTask(
             pipeline,
@@ -30,20 +41,35 @@ class PipelineExecutor:
         )
         session.task = task
 
-        runner = PipelineRunner()
+        runner = self._runner
+        if runner is None:
+            runner = self._runner = PipelineRunner()
         session.runner = runner
 
-        pipeline_task = asyncio.create_task(runner.run(task))
+        # Named so asyncio.all_tasks() and traceback output identify the
+        # session when many pipelines run concurrently
+        pipeline_task = asyncio.create_task(
+            runner.run(task),
+            name=f"pipeline-runner:{session.session_id}",
+        )
         session.pipeline_background_task = pipeline_task
 
         def on_done(fut):
             try:
                 fut.result()
-            except Exception as e:
+            except Exception:
                 logger.error(
-                    f"[PIPELINE] Pipeline failed for session {session.session_id}",
+                    "[PIPELINE] Pipeline failed for session %s",
+                    session.session_id,
                     exc_info=True,
                 )
 
         pipeline_task.add_done_callback(on_done)
-        await pipeline_task
+        return pipeline_task
+
+    @staticmethod
+    async def await_done(task: asyncio.Task) -> None:
+        """
+        Wait for a previously started pipeline task to finish.
+        """
+        await task
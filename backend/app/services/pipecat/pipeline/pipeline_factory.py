@@ -95,14 +95,23 @@ class PipelineFactory:
         """
         return self.llm_factory.create_llm_service(config)
 
+    def invalidate(self) -> None:
+        """
+        Drop all cached service instances in the sub-factories.
+
+        Intended for config reloads (e.g. rotated API keys), after which
+        the next pipeline build reconstructs providers from fresh settings.
+        """
+        self.stt_factory.clear_cache()
+        self.tts_factory.clear_cache()
+        self.llm_factory.clear_cache()
+
 
-# Singleton instance
-_pipeline_factory: PipelineFactory = None
+# Eager singleton: pure composition over the service factories, built at
+# import so the accessor is a plain return
+_pipeline_factory: PipelineFactory = PipelineFactory()
 
 
 def get_pipeline_factory() -> PipelineFactory:
-    """Get or create the PipelineFactory singleton."""
-    global _pipeline_factory
-    if _pipeline_factory is None:
-        _pipeline_factory = PipelineFactory()
+    """Get the PipelineFactory singleton."""
     return _pipeline_factory
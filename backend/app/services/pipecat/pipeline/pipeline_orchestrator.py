@@ -7,7 +7,6 @@ actual work to SRP-compliant collaborators.
 """
 
 import logging
-from typing import Optional
 
 from app.services.pipecat.pipeline.pipeline_builder import PipelineBuilder
 from app.services.pipecat.transport.transport_factory import TransportFactory
@@ -18,8 +17,6 @@ from app.services.pipecat.call.call_completion_service import get_call_completio
 
 logger = logging.getLogger(__name__)
 
-_pipeline_orchestrator: Optional["PipelineOrchestrator"] = None
-
 
 class PipelineOrchestrator:
     """
@@ -54,23 +51,31 @@ class PipelineOrchestrator:
         2. Execute pipeline
         3. Finalize session (always)
         """
-        logger.info(f"[PIPELINE] Starting {session.transport.name} pipeline for session {session.session_id}")
+        logger.info("[PIPELINE] Starting %s pipeline for session %s", session.transport.name, session.session_id)
         
         try:
+            # Prompt placeholder filling runs concurrently with room
+            # creation; the final prompt must land before the context
+            # is seeded
+            await session.prompt_ready.wait()
             pipeline = self.pipeline_builder.build(session)
             session.pipeline = pipeline
-            await self.pipeline_executor.run(pipeline, session)
+            task = self.pipeline_executor.start(pipeline, session)
+            await self.pipeline_executor.await_done(task)
         finally:
             await self.session_finalizer.finalize(session)
 
 
+# Eager singleton: construction is pure composition, and building it at
+# import removes the check-then-set race (and a branch per call) that the
+# lazy pattern carried under concurrent cold-start requests
+_pipeline_orchestrator: PipelineOrchestrator = PipelineOrchestrator()
+
+
 def get_pipeline_orchestrator() -> PipelineOrchestrator:
     """
     Singleton accessor.
 
     Ensures exactly one orchestrator instance exists per process.
     """
-    global _pipeline_orchestrator
-    if _pipeline_orchestrator is None:
-        _pipeline_orchestrator = PipelineOrchestrator()
     return _pipeline_orchestrator
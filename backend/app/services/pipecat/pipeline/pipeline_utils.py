@@ -12,6 +12,7 @@ Responsibilities:
 """
 
 import asyncio
+import functools
 import logging
 from typing import Dict, Any
 
@@ -20,6 +21,18 @@ from app.services.cost.cost_calculator import get_cost_calculator
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _dump_cost_breakdown(cost) -> Dict[str, Any]:
+    """
+    Serialize a CostBreakdown once per distinct instance.
+
+    The calculator caches and shares frozen breakdowns across calls with
+    identical bucketed inputs, so the pydantic model walk is paid once
+    per breakdown rather than per finalize.
+    """
+    return cost.model_dump()
+
+
 class PipecatSessionUtils:
     """
     Utility helpers for Pipecat session lifecycle.
@@ -37,17 +50,56 @@ class PipecatSessionUtils:
         if not task or task.done():
             return
 
-        logger.info(
-            f"[UTIL] Cancelling pipeline task for session {session.session_id}"
-        )
+        logger.info("[UTIL] Cancelling pipeline task %s", task.get_name())
 
         task.cancel()
         try:
             await task
         except asyncio.CancelledError:
-            logger.info("[UTIL] Pipeline task cancelled")
+            logger.info("[UTIL] Pipeline task %s cancelled", task.get_name())
         except Exception as e:
-            logger.warning(f"[UTIL] Error cancelling pipeline task: {e}")
+            logger.warning(
+                "[UTIL] Error cancelling pipeline task %s: %s",
+                task.get_name(),
+                e,
+            )
+
+    @staticmethod
+    async def cancel_pipelines(sessions, timeout: float = 2.0) -> None:
+        """
+        Cancel the pipeline tasks of many sessions in one pass.
+
+        Issues every cancel first, then waits on all tasks together with
+        a single timeout, instead of awaiting each cancellation serially.
+
+        Args:
+            sessions: Iterable of session states to cancel
+            timeout: Seconds to wait for the cancelled tasks to finish
+        """
+        tasks = [
+            task
+            for task in (
+                getattr(session, "pipeline_background_task", None)
+                for session in sessions
+            )
+            if task and not task.done()
+        ]
+
+        if not tasks:
+            return
+
+        logger.info("[UTIL] Cancelling %d pipeline tasks", len(tasks))
+
+        for task in tasks:
+            task.cancel()
+
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            logger.warning(
+                "[UTIL] %d pipeline tasks still running %.1fs after cancel",
+                len(pending),
+                timeout,
+            )
 
     @staticmethod
     async def finalize_session(session, call_completion_service) -> None:
@@ -91,6 +143,6 @@ class PipecatSessionUtils:
             "session_id": session.session_id,
             "transcript": session.transcript,
             "duration_seconds": session.duration_seconds,
-            "cost_breakdown": cost.model_dump(),
+            "cost_breakdown": _dump_cost_breakdown(cost),
             "status": "completed",
         }
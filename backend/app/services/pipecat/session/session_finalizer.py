@@ -21,21 +21,29 @@ class SessionFinalizer:
         """
         Finalize session lifecycle.
         """
-        logger.info(f"[PIPELINE CLEANUP] Finalizing session {session.session_id}")
+        logger.info("[PIPELINE CLEANUP] Finalizing session %s", session.session_id)
 
-        if not session.end_time:
-            session.calculate_duration()
+        # end_call can finalize the same session concurrently; the
+        # session's guard makes whichever path arrives second a no-op
+        async with session.finalize_lock:
+            if session.finalized:
+                return
 
-        if not session.transcript:
-            self._extract_from_context(session)
+            if not session.end_time:
+                session.calculate_duration()
 
-        if not session.metrics_saved:
-            await self.call_completion_service.complete_call(
-                session.session_id,
-                session,
-            )
-            session.metrics_saved = True
-            logger.info("[PIPELINE CLEANUP] Database updated")
+            if not session.transcript:
+                self._extract_from_context(session)
+
+            if not session.metrics_saved:
+                await self.call_completion_service.complete_call(
+                    session.session_id,
+                    session,
+                )
+                session.metrics_saved = True
+                logger.info("[PIPELINE CLEANUP] Database updated")
+
+            session.finalized = True
 
     def _extract_from_context(self, session):
         """
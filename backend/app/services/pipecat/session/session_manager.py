@@ -7,15 +7,23 @@ including active and completed sessions.
 import logging
 import asyncio
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 
 from app.schemas.pipeline import PipelineConfig
 from app.schemas.session import PipecatSessionData, SessionTransport, SessionMetrics
 from app.schemas.pipeline import TransportType
+from app.services.pipecat.db.models import CallContext
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now (datetime.utcnow is deprecated in 3.12+)."""
+    return datetime.now(_UTC)
+
 
 @dataclass
 class PipecatSessionState:
@@ -50,12 +58,23 @@ class PipecatSessionState:
     runner: Optional[Any] = None
     llm_context: Optional[Any] = None
     pipeline_background_task: Optional[asyncio.Task] = None
+    # Set once the bot has joined the transport; callers wait on this
+    # instead of a fixed startup delay
+    bot_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    # Set once system_prompt holds the final, placeholder-filled text;
+    # prompt filling runs concurrently with room creation, so the
+    # pipeline waits on this before seeding the LLM context
+    prompt_ready: asyncio.Event = field(default_factory=asyncio.Event)
     
+    # Call context (driver/load info known at call start; saves a DB fetch
+    # during completion)
+    call_context: Optional[CallContext] = None
+
     # Conversation data
     transcript: List[Dict[str, str]] = field(default_factory=list)
     
     # Metrics
-    start_time: datetime = field(default_factory=datetime.utcnow)
+    start_time: datetime = field(default_factory=_utcnow)
     end_time: Optional[datetime] = None
     duration_seconds: Optional[float] = None
     total_input_tokens: Optional[int] = None
@@ -64,6 +83,10 @@ class PipecatSessionState:
     
     # State flags
     metrics_saved: bool = False
+    # Finalization guard: end_call and the pipeline finalizer can race;
+    # the lock plus flag guarantees the completion write runs once
+    finalized: bool = False
+    finalize_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     
     def add_transcript_message(self, message: Dict[str, str]):
         """
@@ -78,7 +101,7 @@ class PipecatSessionState:
     def calculate_duration(self):
         """Calculate and set session duration."""
         if not self.end_time:
-            self.end_time = datetime.utcnow()
+            self.end_time = _utcnow()
         
         self.duration_seconds = (self.end_time - self.start_time).total_seconds()
     
@@ -139,17 +162,19 @@ class SessionManager:
         call_id: str,
         config: PipelineConfig,
         system_prompt: str,
-        transport: TransportType
+        transport: TransportType,
+        call_context: Optional[CallContext] = None
     ) -> PipecatSessionState:
         """
         Create a new session.
-        
+
         Args:
             session_id: Unique session identifier
             call_id: Associated call record ID
             config: Pipeline configuration
             system_prompt: System prompt for LLM
-            
+            call_context: Driver/load context known at call start
+
         Returns:
             New PipecatSessionState instance
         """
@@ -159,6 +184,7 @@ class SessionManager:
             config=config,
             system_prompt=system_prompt,
             transport=transport,
+            call_context=call_context,
         )
         
         self.active_sessions[session_id] = session
@@ -184,6 +210,26 @@ class SessionManager:
         # Check completed sessions
         return self.completed_sessions.get(session_id)
     
+    def lookup(self, session_id: str) -> tuple:
+        """
+        Look up a session and whether it has completed, in one pass.
+
+        Saves callers that need both facts (end_call) from probing the
+        active and completed dicts separately.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Tuple of (PipecatSessionState or None, is_completed)
+        """
+        session = self.active_sessions.get(session_id)
+        if session is not None:
+            return session, False
+
+        session = self.completed_sessions.get(session_id)
+        return session, session is not None
+
     def get_active_session(self, session_id: str) -> Optional[PipecatSessionState]:
         """
         Get an active session by ID.
@@ -253,7 +299,7 @@ class SessionManager:
         Args:
             max_age_hours: Maximum age in hours for completed sessions to keep
         """
-        cutoff_time = datetime.utcnow()
+        cutoff_time = _utcnow()
         removed_count = 0
         
         for session_id in list(self.completed_sessions.keys()):
@@ -268,18 +314,16 @@ class SessionManager:
             logger.info(f"Cleaned up {removed_count} old completed sessions")
 
 
-# Singleton instance
-_session_manager: Optional[SessionManager] = None
+# Eager singleton: the manager owns the session maps, so a first-use race
+# constructing two instances would silently split session state
+_session_manager: SessionManager = SessionManager()
 
 
 def get_session_manager() -> SessionManager:
     """
-    Get or create the SessionManager singleton.
-    
+    Get the SessionManager singleton.
+
     Returns:
         Singleton instance of SessionManager
     """
-    global _session_manager
-    if _session_manager is None:
-        _session_manager = SessionManager()
     return _session_manager
@@ -5,7 +5,7 @@ Main factory for creating Speech-to-Text service instances
 based on pipeline configuration.
 """
 import logging
-from typing import Any, Optional
+from typing import Any
 
 from app.schemas.pipeline import PipelineConfig, STTService
 from app.core.config import settings
@@ -32,7 +32,16 @@ class STTServiceFactory:
     
     def __init__(self):
         """Initialize the STT service factory."""
+        # Instances keyed by provider configuration: rebuilding a client
+        # per pipeline discards its warm connection pool, so identical
+        # configurations reuse one instance (same pattern as the LLM
+        # factory)
+        self._cache: dict = {}
         logger.debug("STTServiceFactory initialized")
+
+    def clear_cache(self) -> None:
+        """Drop all cached service instances (intended for tests)."""
+        self._cache.clear()
     
     def create_stt_service(self, config: PipelineConfig) -> Any:
         """
@@ -57,13 +66,21 @@ class STTServiceFactory:
             >>> stt = factory.create_stt_service(config)
         """
         service_type = config.stt_config.service
-        
-        logger.info(f"Creating STT service: {service_type.value}")
-        
+
         # Route to appropriate service factory
         if service_type == STTService.DEEPGRAM:
-            return self._create_deepgram(config)
-        
+            deepgram_config = config.stt_config.deepgram
+            cache_key = (service_type, deepgram_config.model, deepgram_config.language)
+            service = self._cache.get(cache_key)
+            if service is not None:
+                logger.debug("Reusing cached STT service: %s", service_type.value)
+                return service
+
+            logger.info(f"Creating STT service: {service_type.value}")
+            service = self._create_deepgram(config)
+            self._cache[cache_key] = service
+            return service
+
         elif service_type == STTService.AZURE_SPEECH:
             return self._create_azure_speech(config)
         
@@ -122,18 +139,16 @@ class STTServiceFactory:
         )
 
 
-# Singleton instance
-_stt_factory: Optional[STTServiceFactory] = None
+# Eager singleton: construction only initializes the instance cache, so
+# building it at import makes the accessor a plain return
+_stt_factory: STTServiceFactory = STTServiceFactory()
 
 
 def get_stt_service_factory() -> STTServiceFactory:
     """
-    Get or create the STTServiceFactory singleton.
-    
+    Get the STTServiceFactory singleton.
+
     Returns:
         Singleton instance of STTServiceFactory
     """
-    global _stt_factory
-    if _stt_factory is None:
-        _stt_factory = STTServiceFactory()
     return _stt_factory
@@ -6,7 +6,7 @@ by intercepting frames in the Pipecat pipeline.
 """
 import logging
 from typing import TYPE_CHECKING
-from datetime import datetime
+from datetime import datetime, timezone
 
 if TYPE_CHECKING:
     from app.services.pipecat.session.session_manager import PipecatSessionState
@@ -82,44 +82,47 @@ class TranscriptCaptureProcessor(FrameProcessor):
     async def _capture_user_speech(self, frame: TranscriptionFrame):
         """
         Capture and store user speech from transcription frame.
-        
+
         Args:
             frame: TranscriptionFrame containing user speech
         """
-        text = frame.text
-        
-        # Only capture non-empty text
-        if text and text.strip():
-            logger.info(f"[TRANSCRIPT] Captured user speech: {text[:100]}")
-            
-            message = {
-                "role": "user",
-                "content": text.strip(),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            self.session.add_transcript_message(message)
-    
+        self._capture("user", frame.text)
+
     async def _capture_bot_response(self, frame: TextFrame):
         """
         Capture and store bot responses from text frame.
-        
+
         Args:
             frame: TextFrame containing bot response
         """
-        text = frame.text
-        
-        # Only capture non-empty text
-        if text and text.strip():
-            logger.info(f"[TRANSCRIPT] Captured bot response: {text[:100]}")
-            
-            message = {
-                "role": "assistant",
-                "content": text.strip(),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            self.session.add_transcript_message(message)
+        self._capture("assistant", frame.text)
+
+    def _capture(self, role: str, text: str):
+        """
+        Store a non-empty message on the session transcript.
+
+        Runs per frame, so text is stripped once and the preview log is
+        gated to avoid slicing/formatting when DEBUG is off.
+
+        Args:
+            role: Message role ("user" or "assistant")
+            text: Raw frame text
+        """
+        if not text:
+            return
+
+        stripped = text.strip()
+        if not stripped:
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[TRANSCRIPT] Captured %s message: %s", role, stripped[:100])
+
+        self.session.add_transcript_message({
+            "role": role,
+            "content": stripped,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
 
 
 def create_transcript_processor(session: 'PipecatSessionState') -> TranscriptCaptureProcessor:
@@ -135,7 +138,6 @@ def create_transcript_processor(session: 'PipecatSessionState') -> TranscriptCap
     Raises:
         ImportError: If Pipecat is not available
     """
-    if not PIPECAT_AVAILABLE:
-        raise ImportError("Pipecat framework not available")
-    
+    # Availability is enforced by TranscriptCaptureProcessor.__init__;
+    # checking here as well doubled the guard on every pipeline build
     return TranscriptCaptureProcessor(session)
@@ -8,6 +8,31 @@ from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Role labels precomputed for the closed set of conversation roles;
+# unseen roles are uppercased once and memoized into the table
+_ROLE_PREFIXES = {
+    "user": "USER: ",
+    "assistant": "ASSISTANT: ",
+    "system": "SYSTEM: ",
+    "unknown": "UNKNOWN: ",
+}
+
+
+def _role_token(role: str) -> str:
+    """
+    Get the formatted role label for a message.
+
+    Args:
+        role: Message role (e.g. 'user', 'assistant')
+
+    Returns:
+        Role label ready for concatenation (e.g. 'USER: ')
+    """
+    prefix = _ROLE_PREFIXES.get(role)
+    if prefix is None:
+        prefix = _ROLE_PREFIXES[role] = role.upper() + ": "
+    return prefix
+
 
 class TranscriptFormatter:
     """
@@ -46,20 +71,17 @@ class TranscriptFormatter:
             return ""
         
         try:
-            formatted_messages = []
-            
-            for msg in transcript:
-                role = msg.get('role', 'unknown').upper()
-                content = msg.get('content', '')
-                
-                if content:  # Only include messages with content
-                    formatted_messages.append(f"{role}: {content}")
-            
-            result = "\n\n".join(formatted_messages)
-            logger.debug(f"[TRANSCRIPT_FORMATTER] Formatted {len(formatted_messages)} messages")
-            
+            # Generator into join: no intermediate list of formatted
+            # strings, and role labels come from a per-role cache
+            result = "\n\n".join(
+                _role_token(msg.get('role', 'unknown')) + msg['content']
+                for msg in transcript
+                if msg.get('content')  # Only include messages with content
+            )
+            logger.debug("[TRANSCRIPT_FORMATTER] Formatted %s messages", len(transcript))
+
             return result
-            
+
         except Exception as e:
             logger.error(f"[TRANSCRIPT_FORMATTER] Error formatting transcript: {e}", exc_info=True)
             return ""
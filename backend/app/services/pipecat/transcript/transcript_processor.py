@@ -10,6 +10,7 @@ from openai import OpenAI
 from pydantic import ValidationError
 
 from app.core.config import settings
+from app.services.pipecat.db.models import CallContext
 from app.schemas.call import (
     CallOutcome,
     DriverStatus,
@@ -128,7 +129,7 @@ class TranscriptProcessor:
     async def process_transcript_with_llm(
             self,
             transcript: str,
-            call_context: Dict[str, Any],
+            call_context: CallContext,
             is_emergency: bool = False
     ) -> Dict[str, Any]:
         """
@@ -178,15 +179,15 @@ class TranscriptProcessor:
     def _build_routine_extraction_prompt(
             self,
             transcript: str,
-            call_context: Dict[str, Any]
+            call_context: CallContext
     ) -> str:
         """Build prompt for routine call data extraction."""
         return f"""Extract structured information from this logistics dispatch call transcript.
 
 Call Context:
-- Driver Name: {call_context.get('driver_name', 'Unknown')}
-- Load Number: {call_context.get('load_number', 'Unknown')}
-- Route: {call_context.get('origin', 'Unknown')} to {call_context.get('destination', 'Unknown')}
+- Driver Name: {call_context.driver_name or 'Unknown'}
+- Load Number: {call_context.load_number or 'Unknown'}
+- Route: {call_context.origin or 'Unknown'} to {call_context.destination or 'Unknown'}
 
 Transcript:
 {transcript}
@@ -207,14 +208,14 @@ Return only valid JSON. Use null for unknown values."""
     def _build_emergency_extraction_prompt(
             self,
             transcript: str,
-            call_context: Dict[str, Any]
+            call_context: CallContext
     ) -> str:
         """Build prompt for emergency call data extraction."""
         return f"""Extract structured information from this emergency logistics call transcript.
 
 Call Context:
-- Driver Name: {call_context.get('driver_name', 'Unknown')}
-- Load Number: {call_context.get('load_number', 'Unknown')}
+- Driver Name: {call_context.driver_name or 'Unknown'}
+- Load Number: {call_context.load_number or 'Unknown'}
 
 Transcript:
 {transcript}
@@ -307,7 +308,7 @@ Return only valid JSON. Use null for unknown values."""
             self,
             call_id: str,
             transcript: str,
-            call_context: Dict[str, Any]
+            call_context: CallContext
     ) -> CallResultsCreate:
         """
         Process a call transcript and return structured results.
@@ -315,7 +316,8 @@ Return only valid JSON. Use null for unknown values."""
         Args:
             call_id: ID of the call
             transcript: Full transcript text
-            call_context: Context about the call
+            call_context: Context about the call (passed as the model
+                directly - no intermediate dict dump)
 
         Returns:
             CallResultsCreate schema with extracted data
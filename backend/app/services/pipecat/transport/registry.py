@@ -30,6 +30,9 @@ class TransportRegistry:
         }
 
     def get(self, transport_type):
-        if transport_type not in self._registry:
+        # Single lookup: the membership check plus subscript hashed the
+        # enum twice on a path hit at every session start
+        handler = self._registry.get(transport_type)
+        if handler is None:
             raise ValueError(f"Unsupported transport: {transport_type}")
-        return self._registry[transport_type]
+        return handler
@@ -18,6 +18,20 @@ from app.schemas.pipeline import TransportType
 
 logger = logging.getLogger(__name__)
 
+# Shared VAD analyzer: the Silero model load costs hundreds of ms, and the
+# analyzer is stateless per-frame, so one instance serves every transport
+# instead of reloading the model per session
+_vad_analyzer = None
+
+
+def _get_shared_vad_analyzer() -> SileroVADAnalyzer:
+    """Get (or build on first use) the shared Silero VAD analyzer."""
+    global _vad_analyzer
+    if _vad_analyzer is None:
+        _vad_analyzer = SileroVADAnalyzer()
+        logger.info("[PIPELINE] Silero VAD analyzer loaded")
+    return _vad_analyzer
+
 
 class TransportFactory:
     """
@@ -50,6 +64,11 @@ class TransportFactory:
             ),
         )
 
+        @transport.event_handler("on_joined")
+        async def _on_joined(transport, data):
+            # Unblocks the start path waiting on the bot to join the room
+            session.bot_ready.set()
+
         logger.info("[PIPELINE] Daily transport created")
         return transport
 
@@ -63,7 +82,7 @@ class TransportFactory:
                 audio_in_enabled=True,
                 audio_out_enabled=True,
                 add_wav_header=False,
-                vad_analyzer=SileroVADAnalyzer(),
+                vad_analyzer=_get_shared_vad_analyzer(),
                 session_timeout=180,
             )
         )
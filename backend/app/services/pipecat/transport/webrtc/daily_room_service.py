@@ -4,17 +4,27 @@ Daily.co Room Management Service.
 Handles creation and management of Daily.co video/audio rooms
 for WebRTC-based voice calls.
 """
+import asyncio
+import functools
 import logging
+import random
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import aiohttp
+import orjson
 
 from app.core.config import settings
 from app.schemas.session import DailyRoomConfig, DailyRoomResponse
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Transient Daily.co responses worth retrying; anything else fails fast
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 1.0
+
 
 class DailyRoomService:
     """
@@ -30,46 +40,87 @@ class DailyRoomService:
         """Initialize the Daily room service."""
         if not settings.daily_api_key:
             logger.warning("DAILY_API_KEY not configured - Daily.co rooms will not be available")
-        
+
         self.api_base_url = "https://api.daily.co/v1"
         self.api_key = settings.daily_api_key
-    
+        # Headers never change per-request, so build them once
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # Shared session with keep-alive so TLS to api.daily.co is paid once,
+        # not per room creation; created lazily on the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Static part of the meeting-token payload; per-call fields are
+        # spread into a copy instead of rebuilding the nested dict each time
+        self._token_props_template = {"is_owner": True}
+
     def _get_headers(self) -> Dict[str, str]:
         """
         Get HTTP headers for Daily.co API requests.
-        
+
         Returns:
             Dictionary of HTTP headers with authorization
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-    
+        return self._headers
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get or lazily create the shared aiohttp session.
+
+        Returns:
+            Pooled ClientSession with connection keep-alive
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared aiohttp session (called on application shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            self._session = None
+
+
     async def create_room(self, config: DailyRoomConfig) -> DailyRoomResponse:
         """
         Create a Daily.co room for a voice call session.
-        
+
+        The room name is derived deterministically from the session ID, so
+        the meeting-token request has no real data dependency on the room
+        response and both calls are issued in a single overlapped round trip.
+        A failure in either leg fails the whole setup as one unit (with
+        best-effort room cleanup when only the token leg fails).
+
         Args:
             config: Configuration for room creation
-            
+
         Returns:
             DailyRoomResponse with room URL and token
-            
+
         Raises:
             Exception: If Daily API key is not configured or room creation fails
         """
         if not self.api_key:
             raise Exception("DAILY_API_KEY not configured")
         
-        logger.info(f"Creating Daily.co room for session: {config.session_id}")
+        logger.info("Creating Daily.co room for session: %s", config.session_id)
         
         # Generate room name from session ID (use first 8 chars for brevity)
         room_name = f"dispatcher-{config.session_id[:8]}"
         
         # Calculate expiry timestamp
+        # Derive both expiry representations from a single clock read
         exp_timestamp = int(time.time()) + (config.expiry_hours * 3600)
-        expires_at = datetime.utcnow() + timedelta(hours=config.expiry_hours)
+        expires_at = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
         
         # Prepare room configuration
         room_config = {
@@ -82,18 +133,34 @@ class DailyRoomService:
             }
         }
         
-        async with aiohttp.ClientSession() as session:
-            # Step 1: Create the room
-            room_url = await self._create_room_api(session, room_config)
-            
-            # Step 2: Create meeting token for bot authentication
-            token = await self._create_meeting_token_api(
-                session,
-                room_name,
-                exp_timestamp
-            )
-        
-        logger.info(f"Successfully created Daily.co room: {room_url}")
+        session = await self._get_session()
+
+        # The token request only needs room_name and exp_timestamp, both
+        # known up front, so both API calls run concurrently - one RTT on
+        # the session-setup critical path instead of two. TaskGroup cancels
+        # the surviving leg as soon as the other fails, instead of letting
+        # it run to completion only to discard the result.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                room_task = tg.create_task(
+                    self._create_room_api(session, room_config)
+                )
+                token_task = tg.create_task(
+                    self._create_meeting_token_api(session, room_name, exp_timestamp)
+                )
+        except* Exception as eg:
+            # If the room was created but its token failed, clean up so we
+            # don't leak rooms in Daily.co
+            if (room_task.done() and not room_task.cancelled()
+                    and room_task.exception() is None):
+                await self._delete_room_api(session, room_name)
+            raise eg.exceptions[0]
+
+        room_url = room_task.result()
+        token = token_task.result()
+
+
+        logger.info("Successfully created Daily.co room: %s", room_url)
         
         return DailyRoomResponse(
             room_url=room_url,
@@ -121,20 +188,102 @@ class DailyRoomService:
             Exception: If API request fails
         """
         url = f"{self.api_base_url}/rooms"
-        
-        async with session.post(
-            url,
-            json=room_config,
-            headers=self._get_headers()
-        ) as response:
-            if response.status not in [200, 201]:
-                error_text = await response.text()
-                logger.error(f"Failed to create Daily room: {error_text}")
-                raise Exception(f"Failed to create Daily room: {error_text}")
-            
-            room_data = await response.json()
-            return room_data["url"]
+
+        room_data = await self._post_with_retry(
+            session, url, room_config, "create Daily room"
+        )
+        return room_data["url"]
+
+    async def _post_with_retry(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        payload: Dict[str, Any],
+        action: str
+    ) -> Dict[str, Any]:
+        """
+        POST to the Daily.co API with retries on transient failures.
+
+        Retries 429/5xx responses and connection errors with jittered
+        exponential backoff, honoring Retry-After on 429. Non-transient
+        errors fail immediately so callers see them on the first attempt.
+
+        Args:
+            session: aiohttp client session
+            url: Full API endpoint URL
+            payload: JSON request body
+            action: Human-readable action for error messages
+
+        Returns:
+            Parsed JSON response body
+
+        Raises:
+            Exception: If the request ultimately fails
+        """
+        delay = _RETRY_BASE_DELAY
+        for attempt in range(1, _RETRY_ATTEMPTS + 1):
+            try:
+                async with session.post(
+                    url,
+                    json=payload,
+                    headers=self._get_headers()
+                ) as response:
+                    if response.status in (200, 201):
+                        return orjson.loads(await response.read())
+
+                    error_text = await response.text()
+                    if response.status not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+                        logger.error("Failed to %s: %s", action, error_text)
+                        raise Exception(f"Failed to {action}: {error_text}")
+
+                    # Retry-After may be either seconds or an HTTP-date
+                    # (RFC 9110); fall back to backoff if it isn't numeric
+                    wait = None
+                    retry_after = response.headers.get("Retry-After")
+                    if retry_after:
+                        try:
+                            wait = float(retry_after)
+                        except ValueError:
+                            pass
+                    if wait is None:
+                        wait = min(delay, _RETRY_MAX_DELAY) * (1 + random.random())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == _RETRY_ATTEMPTS:
+                    logger.error("Failed to %s: %s", action, e)
+                    raise
+                wait = min(delay, _RETRY_MAX_DELAY) * (1 + random.random())
+
+            logger.warning("Transient failure on %s (attempt %s/%s), retrying in %.2fs",
+                           action, attempt, _RETRY_ATTEMPTS, wait)
+            await asyncio.sleep(wait)
+            delay *= 2
+
+        raise Exception(f"Failed to {action}: retries exhausted")
     
+    async def _delete_room_api(
+        self,
+        session: aiohttp.ClientSession,
+        room_name: str
+    ) -> None:
+        """
+        Call Daily.co API to delete a room (best effort).
+
+        Used to clean up after partial failures during room setup;
+        errors are logged but not raised.
+
+        Args:
+            session: aiohttp client session
+            room_name: Name of the room to delete
+        """
+        url = f"{self.api_base_url}/rooms/{room_name}"
+
+        try:
+            async with session.delete(url, headers=self._get_headers()) as response:
+                if response.status not in [200, 204]:
+                    logger.warning("Failed to delete Daily room %s: %s", room_name, response.status)
+        except Exception as e:
+            logger.warning("Error deleting Daily room %s: %s", room_name, e)
+
     async def _create_meeting_token_api(
         self,
         session: aiohttp.ClientSession,
@@ -159,38 +308,27 @@ class DailyRoomService:
         
         token_config = {
             "properties": {
+                **self._token_props_template,
                 "room_name": room_name,
-                "is_owner": True,
                 "exp": exp_timestamp,
             }
         }
-        
-        async with session.post(
-            url,
-            json=token_config,
-            headers=self._get_headers()
-        ) as response:
-            if response.status not in [200, 201]:
-                error_text = await response.text()
-                logger.error(f"Failed to create meeting token: {error_text}")
-                raise Exception(f"Failed to create meeting token: {error_text}")
-            
-            token_data = await response.json()
-            return token_data["token"]
-
 
-# Singleton instance
-_daily_room_service: DailyRoomService = None
+        token_data = await self._post_with_retry(
+            session, url, token_config, "create meeting token"
+        )
+        return token_data["token"]
 
 
+@functools.lru_cache(maxsize=1)
 def get_daily_room_service() -> DailyRoomService:
     """
     Get or create the DailyRoomService singleton.
-    
+
+    lru_cache makes construction race-free under concurrent first calls
+    and turns repeat lookups into a C-level cache hit.
+
     Returns:
         Singleton instance of DailyRoomService
     """
-    global _daily_room_service
-    if _daily_room_service is None:
-        _daily_room_service = DailyRoomService()
-    return _daily_room_service
+    return DailyRoomService()
@@ -40,16 +40,17 @@ class DailyPipecatTransport(PipecatTransport):
         session.daily_room_url = daily_room.room_url
         session.daily_token = daily_room.token
 
-        # Start pipeline asynchronously
+        # Start pipeline asynchronously and return the room credentials
+        # immediately: the client's WebRTC negotiation then overlaps the
+        # bot's join and service warmup instead of waiting behind them.
+        # session.bot_ready still records the join for anyone who needs it.
         asyncio.create_task(
-            self.pipeline_orchestrator.run_pipeline(session)
+            self.pipeline_orchestrator.run_pipeline(session),
+            name=f"pipeline:{session.session_id}",
         )
 
-        # Small delay so bot joins cleanly
-        await asyncio.sleep(2)
-
         logger.info(
-            f"[TRANSPORT:DAILY] Session {session.session_id} ready"
+            f"[TRANSPORT:DAILY] Session {session.session_id} initialized"
         )
 
         return PipecatCallResponse(
@@ -24,7 +24,8 @@ class WebSocketPipecatTransport(PipecatTransport):
         )
 
         asyncio.create_task(
-            self.pipeline_orchestrator.run_pipeline(session)
+            self.pipeline_orchestrator.run_pipeline(session),
+            name=f"pipeline:{session.session_id}",
         )
 
         return PipecatCallResponse(
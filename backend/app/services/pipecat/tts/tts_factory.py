@@ -5,7 +5,7 @@ Main factory for creating Text-to-Speech service instances
 based on pipeline configuration.
 """
 import logging
-from typing import Any, Optional
+from typing import Any
 
 from app.schemas.pipeline import PipelineConfig, TTSService
 from app.core.config import settings
@@ -33,7 +33,16 @@ class TTSServiceFactory:
     
     def __init__(self):
         """Initialize the TTS service factory."""
+        # Instances keyed by provider configuration: rebuilding a client
+        # per pipeline discards its warm connection pool, so identical
+        # configurations reuse one instance (same pattern as the LLM
+        # factory)
+        self._cache: dict = {}
         logger.debug("TTSServiceFactory initialized")
+
+    def clear_cache(self) -> None:
+        """Drop all cached service instances (intended for tests)."""
+        self._cache.clear()
     
     def create_tts_service(self, config: PipelineConfig) -> Any:
         """
@@ -58,22 +67,39 @@ class TTSServiceFactory:
             >>> tts = factory.create_tts_service(config)
         """
         service_type = config.tts_config.service
-        
-        logger.info(f"Creating TTS service: {service_type.value}")
-        
+
         # Route to appropriate service factory
         if service_type == TTSService.ELEVEN_LABS:
-            return self._create_elevenlabs(config)
-        
+            el_config = config.tts_config.eleven_labs
+            cache_key = (service_type, el_config.voice_id, el_config.model_id)
+            create = self._create_elevenlabs
+
         elif service_type == TTSService.CARTESIA:
-            return self._create_cartesia(config)
-        
+            cartesia_config = config.tts_config.cartesia
+            cache_key = (
+                service_type,
+                cartesia_config.voice_id,
+                cartesia_config.model_id,
+                cartesia_config.speed,
+            )
+            create = self._create_cartesia
+
         elif service_type == TTSService.AZURE_TTS:
             return self._create_azure_tts(config)
         
         else:
             raise ValueError(f"Unsupported TTS service: {service_type}")
-    
+
+        service = self._cache.get(cache_key)
+        if service is not None:
+            logger.debug("Reusing cached TTS service: %s", service_type.value)
+            return service
+
+        logger.info(f"Creating TTS service: {service_type.value}")
+        service = create(config)
+        self._cache[cache_key] = service
+        return service
+
     def _create_elevenlabs(self, config: PipelineConfig) -> Any:
         """
         Create ElevenLabs TTS service.
@@ -117,18 +143,16 @@ class TTSServiceFactory:
         )
 
 
-# Singleton instance
-_tts_factory: Optional[TTSServiceFactory] = None
+# Eager singleton: construction only initializes the instance cache, so
+# building it at import makes the accessor a plain return
+_tts_factory: TTSServiceFactory = TTSServiceFactory()
 
 
 def get_tts_service_factory() -> TTSServiceFactory:
     """
-    Get or create the TTSServiceFactory singleton.
-    
+    Get the TTSServiceFactory singleton.
+
     Returns:
         Singleton instance of TTSServiceFactory
     """
-    global _tts_factory
-    if _tts_factory is None:
-        _tts_factory = TTSServiceFactory()
     return _tts_factory
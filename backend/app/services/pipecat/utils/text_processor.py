@@ -123,18 +123,16 @@ class TextProcessor:
         return replacements.get(placeholder_key)
 
 
-# Singleton instance
-_text_processor: Optional[TextProcessor] = None
+# Eager singleton: construction is trivial, and a plain return drops the
+# check-then-set branch from an accessor hit on every call start
+_text_processor: TextProcessor = TextProcessor()
 
 
 def get_text_processor() -> TextProcessor:
     """
-    Get or create the TextProcessor singleton.
-    
+    Get the TextProcessor singleton.
+
     Returns:
         Singleton instance of TextProcessor
     """
-    global _text_processor
-    if _text_processor is None:
-        _text_processor = TextProcessor()
     return _text_processor
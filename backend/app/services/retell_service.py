@@ -4,6 +4,7 @@ Retell AI Service - Handles all interactions with Retell AI API.
 Uses Retell's built-in LLM for conversation handling.
 """
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from retell import Retell
 from retell.types import AgentResponse as RetellAgentResponse
@@ -357,13 +358,7 @@ class RetellService:
             raise
 
 
-# Singleton instance
-_retell_service: Optional[RetellService] = None
-
-
+@lru_cache(maxsize=1)
 def get_retell_service() -> RetellService:
-    """Get or create RetellService singleton."""
-    global _retell_service
-    if _retell_service is None:
-        _retell_service = RetellService()
-    return _retell_service
\ No newline at end of file
+    """Get or create the RetellService singleton (race-free first use)."""
+    return RetellService()
\ No newline at end of file
@@ -54,7 +54,11 @@ export function CallResultsView({ call }: CallResultsViewProps) {
   }
 
   const isEmergency = results.is_emergency;
-  const costBreakdown = results.raw_extraction?.cost_breakdown as CostBreakdown | undefined;
+  // New calls store cost in the dedicated column; fall back to the legacy
+  // nested copy for rows written before migration 004
+  const costBreakdown =
+    results.cost_breakdown ??
+    (results.raw_extraction?.cost_breakdown as CostBreakdown | undefined);
 
   return (
     <div className="space-y-4">
@@ -249,6 +249,7 @@ export interface CallResults {
 
   raw_extraction?: Record<string, unknown>;
   confidence_score?: number;
+  cost_breakdown?: CostBreakdown;
   created_at: string;
 }
 
@@ -0,0 +1,78 @@
+-- Migration: Single round-trip call completion
+-- Adds a stored procedure that applies the call status update and the
+-- call_results upsert in one transaction, so completing a Pipecat call
+-- costs one PostgREST round trip instead of two.
+
+-- Upsert target for call_results: one results row per call
+CREATE UNIQUE INDEX IF NOT EXISTS uq_call_results_call_id ON call_results(call_id);
+
+CREATE OR REPLACE FUNCTION complete_pipecat_call(
+    p_call_id UUID,
+    p_update JSONB,
+    p_results JSONB
+) RETURNS VOID AS $$
+BEGIN
+    UPDATE calls SET
+        status = COALESCE(p_update->>'status', status),
+        ended_at = COALESCE((p_update->>'ended_at')::timestamptz, ended_at),
+        updated_at = COALESCE((p_update->>'updated_at')::timestamptz, updated_at),
+        duration_seconds = COALESCE((p_update->>'duration_seconds')::integer, duration_seconds),
+        transcript = COALESCE(p_update->>'transcript', transcript)
+    WHERE id = p_call_id;
+
+    INSERT INTO call_results (
+        call_id,
+        call_outcome,
+        is_emergency,
+        driver_status,
+        current_location,
+        eta,
+        delay_reason,
+        pod_reminder_acknowledged,
+        emergency_type,
+        safety_status,
+        injury_status,
+        emergency_location,
+        load_secure,
+        escalation_status,
+        raw_extraction,
+        confidence_score
+    )
+    VALUES (
+        p_call_id,
+        p_results->>'call_outcome',
+        COALESCE((p_results->>'is_emergency')::boolean, false),
+        p_results->>'driver_status',
+        p_results->>'current_location',
+        p_results->>'eta',
+        p_results->>'delay_reason',
+        COALESCE((p_results->>'pod_reminder_acknowledged')::boolean, false),
+        p_results->>'emergency_type',
+        p_results->>'safety_status',
+        p_results->>'injury_status',
+        p_results->>'emergency_location',
+        (p_results->>'load_secure')::boolean,
+        p_results->>'escalation_status',
+        p_results->'raw_extraction',
+        (p_results->>'confidence_score')::decimal
+    )
+    ON CONFLICT (call_id) DO UPDATE SET
+        call_outcome = EXCLUDED.call_outcome,
+        is_emergency = EXCLUDED.is_emergency,
+        driver_status = EXCLUDED.driver_status,
+        current_location = EXCLUDED.current_location,
+        eta = EXCLUDED.eta,
+        delay_reason = EXCLUDED.delay_reason,
+        pod_reminder_acknowledged = EXCLUDED.pod_reminder_acknowledged,
+        emergency_type = EXCLUDED.emergency_type,
+        safety_status = EXCLUDED.safety_status,
+        injury_status = EXCLUDED.injury_status,
+        emergency_location = EXCLUDED.emergency_location,
+        load_secure = EXCLUDED.load_secure,
+        escalation_status = EXCLUDED.escalation_status,
+        raw_extraction = EXCLUDED.raw_extraction,
+        confidence_score = EXCLUDED.confidence_score;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION complete_pipecat_call IS 'Applies a call status update and upserts its results in one transaction';
@@ -0,0 +1,93 @@
+-- Migration: Dedicated cost_breakdown column on call_results
+-- Cost data was previously nested inside the raw_extraction JSONB blob,
+-- which forces a full-blob rewrite on every completion and prevents
+-- indexed queries on cost fields. Store it in its own column.
+
+ALTER TABLE call_results
+ADD COLUMN IF NOT EXISTS cost_breakdown JSONB;
+
+COMMENT ON COLUMN call_results.cost_breakdown IS 'Per-service cost breakdown (STT, TTS, LLM, transport) for the call';
+
+-- Backfill from raw_extraction where present
+UPDATE call_results
+SET cost_breakdown = raw_extraction->'cost_breakdown'
+WHERE cost_breakdown IS NULL
+  AND raw_extraction ? 'cost_breakdown';
+
+-- Generated column for direct indexing/aggregation of call cost
+ALTER TABLE call_results
+ADD COLUMN IF NOT EXISTS total_cost_usd DECIMAL(10, 6)
+GENERATED ALWAYS AS ((cost_breakdown->>'total_cost_usd')::decimal) STORED;
+
+-- Update the completion procedure to write the new column
+CREATE OR REPLACE FUNCTION complete_pipecat_call(
+    p_call_id UUID,
+    p_update JSONB,
+    p_results JSONB
+) RETURNS VOID AS $$
+BEGIN
+    UPDATE calls SET
+        status = COALESCE(p_update->>'status', status),
+        ended_at = COALESCE((p_update->>'ended_at')::timestamptz, ended_at),
+        updated_at = COALESCE((p_update->>'updated_at')::timestamptz, updated_at),
+        duration_seconds = COALESCE((p_update->>'duration_seconds')::integer, duration_seconds),
+        transcript = COALESCE(p_update->>'transcript', transcript)
+    WHERE id = p_call_id;
+
+    INSERT INTO call_results (
+        call_id,
+        call_outcome,
+        is_emergency,
+        driver_status,
+        current_location,
+        eta,
+        delay_reason,
+        pod_reminder_acknowledged,
+        emergency_type,
+        safety_status,
+        injury_status,
+        emergency_location,
+        load_secure,
+        escalation_status,
+        raw_extraction,
+        confidence_score,
+        cost_breakdown
+    )
+    VALUES (
+        p_call_id,
+        p_results->>'call_outcome',
+        COALESCE((p_results->>'is_emergency')::boolean, false),
+        p_results->>'driver_status',
+        p_results->>'current_location',
+        p_results->>'eta',
+        p_results->>'delay_reason',
+        COALESCE((p_results->>'pod_reminder_acknowledged')::boolean, false),
+        p_results->>'emergency_type',
+        p_results->>'safety_status',
+        p_results->>'injury_status',
+        p_results->>'emergency_location',
+        (p_results->>'load_secure')::boolean,
+        p_results->>'escalation_status',
+        p_results->'raw_extraction',
+        (p_results->>'confidence_score')::decimal,
+        p_results->'cost_breakdown'
+    )
+    ON CONFLICT (call_id) DO UPDATE SET
+        call_outcome = EXCLUDED.call_outcome,
+        is_emergency = EXCLUDED.is_emergency,
+        driver_status = EXCLUDED.driver_status,
+        current_location = EXCLUDED.current_location,
+        eta = EXCLUDED.eta,
+        delay_reason = EXCLUDED.delay_reason,
+        pod_reminder_acknowledged = EXCLUDED.pod_reminder_acknowledged,
+        emergency_type = EXCLUDED.emergency_type,
+        safety_status = EXCLUDED.safety_status,
+        injury_status = EXCLUDED.injury_status,
+        emergency_location = EXCLUDED.emergency_location,
+        load_secure = EXCLUDED.load_secure,
+        escalation_status = EXCLUDED.escalation_status,
+        raw_extraction = EXCLUDED.raw_extraction,
+        confidence_score = EXCLUDED.confidence_score,
+        cost_breakdown = EXCLUDED.cost_breakdown;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,101 @@
+-- Migration: Session-keyed completion procedure
+-- Completion previously needed a SELECT by retell_call_id before calling
+-- complete_pipecat_call. Keying the procedure by session id folds the
+-- lookup, status update, and results upsert into a single round trip and
+-- returns the call context needed by transcript extraction.
+
+CREATE OR REPLACE FUNCTION complete_pipecat_call_by_session(
+    p_session_id TEXT,
+    p_update JSONB,
+    p_results JSONB
+) RETURNS JSONB AS $$
+DECLARE
+    v_id UUID;
+    v_driver_name TEXT;
+    v_load_number TEXT;
+    v_origin TEXT;
+    v_destination TEXT;
+BEGIN
+    UPDATE calls SET
+        status = COALESCE(p_update->>'status', status),
+        ended_at = COALESCE((p_update->>'ended_at')::timestamptz, ended_at),
+        updated_at = COALESCE((p_update->>'updated_at')::timestamptz, updated_at),
+        duration_seconds = COALESCE((p_update->>'duration_seconds')::integer, duration_seconds),
+        transcript = COALESCE(p_update->>'transcript', transcript)
+    WHERE retell_call_id = p_session_id
+    RETURNING id, driver_name, load_number, origin, destination
+    INTO v_id, v_driver_name, v_load_number, v_origin, v_destination;
+
+    IF v_id IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF p_results IS NOT NULL THEN
+        -- The caller may not know the call id yet; the row is keyed on the
+        -- id resolved above, not on p_results->>'call_id'
+        INSERT INTO call_results (
+            call_id,
+            call_outcome,
+            is_emergency,
+            driver_status,
+            current_location,
+            eta,
+            delay_reason,
+            pod_reminder_acknowledged,
+            emergency_type,
+            safety_status,
+            injury_status,
+            emergency_location,
+            load_secure,
+            escalation_status,
+            raw_extraction,
+            confidence_score,
+            cost_breakdown
+        )
+        VALUES (
+            v_id,
+            p_results->>'call_outcome',
+            COALESCE((p_results->>'is_emergency')::boolean, false),
+            p_results->>'driver_status',
+            p_results->>'current_location',
+            p_results->>'eta',
+            p_results->>'delay_reason',
+            COALESCE((p_results->>'pod_reminder_acknowledged')::boolean, false),
+            p_results->>'emergency_type',
+            p_results->>'safety_status',
+            p_results->>'injury_status',
+            p_results->>'emergency_location',
+            (p_results->>'load_secure')::boolean,
+            p_results->>'escalation_status',
+            p_results->'raw_extraction',
+            (p_results->>'confidence_score')::decimal,
+            p_results->'cost_breakdown'
+        )
+        ON CONFLICT (call_id) DO UPDATE SET
+            call_outcome = EXCLUDED.call_outcome,
+            is_emergency = EXCLUDED.is_emergency,
+            driver_status = EXCLUDED.driver_status,
+            current_location = EXCLUDED.current_location,
+            eta = EXCLUDED.eta,
+            delay_reason = EXCLUDED.delay_reason,
+            pod_reminder_acknowledged = EXCLUDED.pod_reminder_acknowledged,
+            emergency_type = EXCLUDED.emergency_type,
+            safety_status = EXCLUDED.safety_status,
+            injury_status = EXCLUDED.injury_status,
+            emergency_location = EXCLUDED.emergency_location,
+            load_secure = EXCLUDED.load_secure,
+            escalation_status = EXCLUDED.escalation_status,
+            raw_extraction = EXCLUDED.raw_extraction,
+            confidence_score = EXCLUDED.confidence_score,
+            cost_breakdown = EXCLUDED.cost_breakdown;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'id', v_id,
+        'driver_name', v_driver_name,
+        'load_number', v_load_number,
+        'origin', v_origin,
+        'destination', v_destination
+    );
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,11 @@
+-- Migration: Single round-trip call deletion
+-- Adds a stored procedure that deletes a call's results row and the call
+-- record together, so deleting a call costs one PostgREST round trip
+-- instead of two sequential DELETE requests.
+
+CREATE OR REPLACE FUNCTION delete_call_cascade(
+    p_call_id UUID
+) RETURNS VOID AS $$
+    DELETE FROM call_results WHERE call_id = p_call_id;
+    DELETE FROM calls WHERE id = p_call_id;
+$$ LANGUAGE sql;